@@ -18,8 +18,9 @@ import re
 import argparse
 import sys
 import os
-import glob
-from typing import Dict, List, Optional, Tuple, Any, Union
+import functools
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Any, Union
 
 # --- ANSI Color Codes ---
 # (Check if stdout is a TTY to enable colors by default)
@@ -35,47 +36,85 @@ C_BLUE = "\033[94m"
 C_MAGENTA = "\033[95m"
 C_CYAN = "\033[96m"
 
-def _col(text: str, color_code: str) -> str:
-    """Applies color codes if enabled."""
-    return f"{color_code}{text}{C_RESET}" if COLOR_ENABLED else text
+def _col_on(text: str, color_code: str) -> str:
+    """Wraps text in the given color code."""
+    return color_code + text + C_RESET
+
+def _col_off(text: str, _color_code: str) -> str:
+    """Returns text unchanged (colors disabled)."""
+    return text
+
+# Bound once to the right variant; rebound when --no-color is given
+_col = _col_on if COLOR_ENABLED else _col_off
 
 # --- Constants and Mappings ---
 
 # JEDEC Life Time Estimates (Bytes 268, 269)
-# Added color hints
-LIFE_TIME_MAP: Dict[int, str] = {
-    0x00: _col("0% used (or not defined)", C_GREEN),
-    0x01: _col("0% - 10% used", C_GREEN),
-    0x02: _col("10% - 20% used", C_GREEN),
-    0x03: _col("20% - 30% used", C_GREEN),
-    0x04: _col("30% - 40% used", C_GREEN),
-    0x05: _col("40% - 50% used", C_YELLOW),
-    0x06: _col("50% - 60% used", C_YELLOW),
-    0x07: _col("60% - 70% used", C_YELLOW),
-    0x08: _col("70% - 80% used", C_YELLOW),
-    0x09: _col("80% - 90% used", C_RED),
-    0x0A: _col("90% - 100% used", C_RED),
-    0x0B: _col("Exceeded estimated life", C_BOLD + C_RED),
+# Added color hints; (text, color) pairs rendered into LIFE_TIME_MAP
+_LIFE_TIME_SPEC: Dict[int, Tuple[str, str]] = {
+    0x00: ("0% used (or not defined)", C_GREEN),
+    0x01: ("0% - 10% used", C_GREEN),
+    0x02: ("10% - 20% used", C_GREEN),
+    0x03: ("20% - 30% used", C_GREEN),
+    0x04: ("30% - 40% used", C_GREEN),
+    0x05: ("40% - 50% used", C_YELLOW),
+    0x06: ("50% - 60% used", C_YELLOW),
+    0x07: ("60% - 70% used", C_YELLOW),
+    0x08: ("70% - 80% used", C_YELLOW),
+    0x09: ("80% - 90% used", C_RED),
+    0x0A: ("90% - 100% used", C_RED),
+    0x0B: ("Exceeded estimated life", C_BOLD + C_RED),
 }
 
 # JEDEC Pre EOL Info (Byte 267)
-PRE_EOL_MAP: Dict[int, str] = {
-    0x00: "Not defined",
-    0x01: _col("Normal", C_GREEN),
-    0x02: _col("Warning (80% consumption)", C_YELLOW),
-    0x03: _col("Urgent (90% consumption)", C_RED),
+_PRE_EOL_SPEC: Dict[int, Tuple[str, str]] = {
+    0x00: ("Not defined", ""),
+    0x01: ("Normal", C_GREEN),
+    0x02: ("Warning (80% consumption)", C_YELLOW),
+    0x03: ("Urgent (90% consumption)", C_RED),
 }
 
 # Background Operation Status (Byte 246)
-BKOPS_STATUS_MAP: Dict[int, str] = {
-    0x00: _col("No operation", C_GREEN),
-    0x01: _col("Performing background operation", C_YELLOW),
+_BKOPS_STATUS_SPEC: Dict[int, Tuple[str, str]] = {
+    0x00: ("No operation", C_GREEN),
+    0x01: ("Performing background operation", C_YELLOW),
     # 0x02+ are vendor specific, indicate potentially busy
-    0x02: _col("Vendor Specific Status 2 (Potentially Busy)", C_YELLOW),
-    0x03: _col("Vendor Specific Status 3 (Potentially Busy)", C_YELLOW),
+    0x02: ("Vendor Specific Status 2 (Potentially Busy)", C_YELLOW),
+    0x03: ("Vendor Specific Status 3 (Potentially Busy)", C_YELLOW),
     # Add more vendor specific codes if known, otherwise default
 }
 
+# Rendered lookup maps, filled in place by _build_labels()
+LIFE_TIME_MAP: Dict[int, str] = {}
+PRE_EOL_MAP: Dict[int, str] = {}
+BKOPS_STATUS_MAP: Dict[int, str] = {}
+
+# Frequently used colored labels, also rendered by _build_labels()
+_YES_G = "Yes"
+_NO_Y = "No"
+_SUPPORTED_G = "Supported"
+_NOT_SUPPORTED_Y = "Not Supported / Unknown"
+_ENABLED_G = "Enabled"
+_UNKNOWN_M = "Unknown"
+
+def _build_labels() -> None:
+    """Pre-renders the colored lookup maps and labels with the current _col."""
+    global _YES_G, _NO_Y, _SUPPORTED_G, _NOT_SUPPORTED_Y, _ENABLED_G, _UNKNOWN_M
+    for spec, rendered in ((_LIFE_TIME_SPEC, LIFE_TIME_MAP),
+                           (_PRE_EOL_SPEC, PRE_EOL_MAP),
+                           (_BKOPS_STATUS_SPEC, BKOPS_STATUS_MAP)):
+        rendered.clear()
+        rendered.update({code: _col(text, color) if color else text
+                         for code, (text, color) in spec.items()})
+    _YES_G = _col("Yes", C_GREEN)
+    _NO_Y = _col("No", C_YELLOW)
+    _SUPPORTED_G = _col("Supported", C_GREEN)
+    _NOT_SUPPORTED_Y = _col("Not Supported / Unknown", C_YELLOW)
+    _ENABLED_G = _col("Enabled", C_GREEN)
+    _UNKNOWN_M = _col("Unknown", C_MAGENTA)
+
+_build_labels()
+
 # Card Type Bits (Byte 196)
 CARD_TYPE_MAP: Dict[int, str] = {
     (1 << 0): "HS eMMC @26MHz - at rated device voltage(s)",
@@ -91,10 +130,66 @@ CARD_TYPE_MAP: Dict[int, str] = {
 # Type alias for parsed data
 ExtCsdData = Dict[str, Dict[str, Any]]
 
+# (register, field, default) values read by _print_device_info()
+_DEVICE_INFO_FIELDS: Tuple[Tuple[str, str, Any], ...] = (
+    ('SEC_COUNT', 'int', None),
+    ('CACHE_SIZE', 'str', "Unknown"),
+    ('CACHE_SIZE', 'num', None),
+    ('TRIM_MULT', 'int', None),
+    ('BKOPS_SUPPORT', 'int', None),
+    ('BKOPS_STATUS', 'int', None),
+    ('CMDQ_SUPPORT', 'int', None),
+    ('CMDQ_DEPTH', 'int', None),
+    ('CMDQ_MODE_EN', 'int', None),
+    ('WR_REL_PARAM', 'int', None),
+    ('POWER_OFF_NOTIFICATION', 'int', None),
+    ('BOOT_SIZE_MULTI', 'int', None),
+    ('RPMB_SIZE_MULT', 'int', None),
+    ('PARTITIONING_SUPPORT', 'int', None),
+    ('PARTITION_SETTING_COMPLETED', 'int', None),
+    ('CARD_TYPE', 'hex', 'N/A'),
+    ('CARD_TYPE', 'supported_types', None),
+    ('CARD_TYPE', 'int', None),
+)
+
 # --- Helper Functions ---
 
-def run_mmc_command(device_path: str) -> str:
-    """Runs the mmc extcsd read command and returns the output."""
+def _extcsd_cache_path(base_device_path: str) -> str:
+    """Returns the on-disk cache file for a device's extcsd output."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "emmc_analyzer",
+                        f"{base_device_path.replace('/', '_')}.extcsd")
+
+def _read_cached_output(cache_path: str, cache_ttl: int) -> Optional[str]:
+    """Returns cached extcsd output if it is younger than cache_ttl seconds."""
+    try:
+        if os.stat(cache_path).st_mtime <= time.time() - cache_ttl:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f_handle:
+            cached = f_handle.read()
+    except (IOError, OSError):
+        return None
+    return cached if cached.strip() else None
+
+def _write_cached_output(cache_path: str, output: str) -> None:
+    """Atomically stores extcsd output in the cache (errors are ignored)."""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f_handle:
+            f_handle.write(output)
+        os.replace(tmp_path, cache_path)
+    except (IOError, OSError) as io_err:
+        print(f"Warning: Could not write cache {cache_path} "
+              f"({type(io_err).__name__}).", file=sys.stderr)
+
+def run_mmc_command(device_path: str, cache_ttl: int = 0,
+                    refresh: bool = False) -> str:
+    """Runs the mmc extcsd read command and returns the output.
+
+    With cache_ttl > 0 the output is cached on disk and reused for that many
+    seconds, unless refresh is set.
+    """
     base_device_path = device_path
     if 'p' in os.path.basename(device_path):
         base_device_path = re.sub(r'p\d+$', '', device_path)
@@ -103,31 +198,42 @@ def run_mmc_command(device_path: str) -> str:
             f"Using base device {base_device_path} instead.", file=sys.stderr
         )
 
+    cache_path = _extcsd_cache_path(base_device_path)
+    if cache_ttl > 0 and not refresh:
+        cached = _read_cached_output(cache_path, cache_ttl)
+        if cached is not None:
+            return cached
+
     command = ["sudo", "mmc", "extcsd", "read", base_device_path]
     try:
         result = subprocess.run(
-            command, capture_output=True, text=True, check=True, timeout=20,
-            encoding='utf-8' # Be explicit
+            command, capture_output=True, check=True, timeout=20
         )
-        if not result.stdout.strip():
+        # Small, complete output: decode the bytes once instead of streaming
+        # them through a text wrapper
+        output = result.stdout.decode('utf-8', errors='replace')
+        if not output.strip():
             print(
                 f"Error: 'mmc extcsd read {base_device_path}' produced no output. "
                 "Check device and permissions.", file=sys.stderr
             )
             sys.exit(1)
-        return result.stdout
+        if cache_ttl > 0:
+            _write_cached_output(cache_path, output)
+        return output
     except FileNotFoundError:
         print("Error: 'mmc' command not found. Is 'mmc-utils' installed "
               "and in PATH?", file=sys.stderr)
         sys.exit(1)
     except subprocess.CalledProcessError as error:
+        stderr = (error.stderr or b"").decode('utf-8', errors='replace')
         print(f"Error running mmc command (Exit code: {error.returncode}): {error}",
               file=sys.stderr)
         print(f"Command: {' '.join(command)}", file=sys.stderr)
-        print(f"Stderr: {error.stderr.strip()}", file=sys.stderr)
-        if "Permission denied" in error.stderr or error.returncode == 13:
+        print(f"Stderr: {stderr.strip()}", file=sys.stderr)
+        if "Permission denied" in stderr or error.returncode == 13:
             print("Hint: Try running the script with 'sudo'.", file=sys.stderr)
-        elif "No such file or directory" in error.stderr:
+        elif "No such file or directory" in stderr:
             print(f"Hint: Ensure the device '{base_device_path}' exists.",
                   file=sys.stderr)
         sys.exit(1)
@@ -142,84 +248,114 @@ def run_mmc_command(device_path: str) -> str:
     return "" # Should not be reached if successful, satisfies mypy
 
 
+# --- ExtCSD Parsing Patterns ---
+# Compiled once at import; parse_extcsd_output() reuses them on every call.
+# The four line formats are merged into one alternation that is matched
+# against each line; the top-level group name tells which format matched.
+# Alternatives are tried in priority order.
+_COMBINED = re.compile(
+    # p2: Key [REGISTER: 0xValue]
+    r"(?P<p2>\s*(?P<p2_key>.*?)\s*\[(?P<p2_reg>.*):\s*(?P<p2_val>0x[0-9a-fA-F]+)\s*\]"
+    r"(?:$|\s*: i\.e\.))"
+    # p1: Key [REGISTER]: 0xValue
+    r"|(?P<p1>\s*(?P<p1_key>.*?)\s+\[(?P<p1_reg>.*?)]:\s*(?P<p1_val>0x[0-9a-fA-F]+)\s*$)"
+    # p3: Key [REGISTER]: DecimalValue
+    r"|(?P<p3>\s*(?P<p3_key>.*?)\s+\[(?P<p3_reg>.*?)]:\s*(?P<p3_val>\d+)\s*$)"
+    # p4: Cache Size specific format
+    r"|(?P<p4>\s*(?P<p4_key>Cache Size)\s+\[(?P<p4_reg>CACHE_SIZE)\]\s+is\s+"
+    r"(?P<p4_val>\d+)\s*(?P<p4_unit>KiB|MiB|GiB)?)")
+# Header of the Card Type block; the indented lines below it list the modes
+_CARD_TYPE_HEADER = re.compile(r"Card Type \[CARD_TYPE: (0x[0-9a-fA-F]+)\]$")
+
+
+def _handle_cache(value: str, unit: Optional[str]) -> Dict[str, Any]:
+    """Extracts fields from a Cache Size value (p4)."""
+    fields: Dict[str, Any] = {'str': f"{value} {unit if unit else ''}".strip()}
+    try:
+        fields['num'] = int(value)
+    except ValueError:
+        pass
+    if unit is not None:
+        fields['unit'] = unit
+    return fields
+
+def _handle_decimal(value: str, _unit: Optional[str]) -> Dict[str, Any]:
+    """Extracts fields from a decimal value (p3)."""
+    fields: Dict[str, Any] = {}
+    try:
+        fields['int'] = int(value)
+    except ValueError:
+        pass
+    fields['str'] = value # Keep string version too
+    return fields
+
+def _handle_hex(value: str, _unit: Optional[str]) -> Dict[str, Any]:
+    """Extracts fields from a hex value (p1 and p2)."""
+    fields: Dict[str, Any] = {'hex': value}
+    try:
+        fields['int'] = int(value, 16)
+    except ValueError:
+        pass
+    return fields
+
+# Top-level group -> (rank, key group, register group, value group,
+# unit group, handler). A lower rank wins when a register is reported
+# by more than one format, matching the old pattern-by-pattern order.
+_ALTERNATIVES = {
+    'p2': (0, 'p2_key', 'p2_reg', 'p2_val', None, _handle_hex),
+    'p1': (1, 'p1_key', 'p1_reg', 'p1_val', None, _handle_hex),
+    'p3': (2, 'p3_key', 'p3_reg', 'p3_val', None, _handle_decimal),
+    'p4': (3, 'p4_key', 'p4_reg', 'p4_val', 'p4_unit', _handle_cache),
+}
+
+
 def parse_extcsd_output(output: str) -> ExtCsdData:
     """Parses the raw text output into a dictionary."""
     data: ExtCsdData = {}
-
-    # Pattern 1: Key [REGISTER]: 0xValue
-    pattern1 = re.compile(r"^\s*(.*?)\s+\[(.*?)]:\s*(0x[0-9a-fA-F]+)\s*$",
-                          re.MULTILINE)
-    # Pattern 2: Key [REGISTER: 0xValue]
-    pattern2 = re.compile(r"^\s*(.*?)\s*\[(.*):\s*(0x[0-9a-fA-F]+)\s*\]"
-                          r"(?:$|\s*: i\.e\.)", re.MULTILINE)
-    # Pattern 3: Key [REGISTER]: DecimalValue
-    pattern3 = re.compile(r"^\s*(.*?)\s+\[(.*?)]:\s*(\d+)\s*$", re.MULTILINE)
-    # Pattern 4: Cache Size specific format
-    pattern4 = re.compile(r"^\s*(Cache Size)\s+\[(CACHE_SIZE)\]\s+is\s+(\d+)"
-                          r"\s*(KiB|MiB|GiB)?", re.MULTILINE)
-    # Pattern 5: Card Type multi-line block
-    pattern5 = re.compile(r"Card Type \[CARD_TYPE: (0x[0-9a-fA-F]+)\]\n"
-                          r"((?:\s+.*?\n)+)", re.MULTILINE)
-
-    # Apply patterns sequentially
-    patterns = [pattern2, pattern1, pattern3, pattern4]
-    for pattern in patterns:
-        for match in pattern.finditer(output):
-            register: str
-            key_desc: str
-            value_hex: Optional[str] = None
-            value_int: Optional[int] = None
-            value_str: Optional[str] = None
-            value_num: Optional[int] = None
-            value_unit: Optional[str] = None
-
-            if pattern == pattern4: # Cache Size
-                key_desc = match.group(1).strip()
-                register = match.group(2).strip()
-                value_num_str = match.group(3).strip()
-                value_unit = match.group(4)
-                try:
-                    value_num = int(value_num_str)
-                    value_str = f"{value_num_str} {value_unit if value_unit else ''}".strip()
-                except ValueError:
-                    value_num = None
-                    value_str = f"{value_num_str} {value_unit if value_unit else ''}".strip()
-
-            elif pattern == pattern3: # Decimal
-                key_desc = match.group(1).strip()
-                register = match.group(2).strip()
-                value_dec_str = match.group(3).strip()
-                try:
-                    value_int = int(value_dec_str)
-                    value_str = value_dec_str # Keep string version too
-                except ValueError:
-                    value_int = None
-                    value_str = value_dec_str
-
-            else: # Hex patterns (pattern1, pattern2)
-                key_desc = match.group(1).strip()
-                register = match.group(2).strip()
-                value_hex = match.group(3).strip()
-                try:
-                    value_int = int(value_hex, 16)
-                except ValueError:
-                    value_int = None
-
-            if register not in data:
-                data[register] = {'key': key_desc}
-                if value_hex is not None: data[register]['hex'] = value_hex
-                if value_int is not None: data[register]['int'] = value_int
-                if value_str is not None: data[register]['str'] = value_str
-                if value_num is not None: data[register]['num'] = value_num
-                if value_unit is not None: data[register]['unit'] = value_unit
-
-    # Apply Pattern 5 (Card Type multi-line)
-    match5 = pattern5.search(output)
-    if match5:
+    ranks: Dict[str, int] = {}
+
+    # A register line with no key of its own (e.g. " [MIN_PERF_W_8_52: 0x00]")
+    # takes the preceding unmatched line as its description.
+    carry = ""
+    card_type_hex: Optional[str] = None
+    supported_types: List[str] = []
+    in_card_type = False
+
+    for line in output.splitlines():
+        if in_card_type:
+            # Card Type block continues until the first unindented/blank line
+            if line[:1].isspace() and line.strip():
+                supported_types.append(line.strip())
+            else:
+                in_card_type = False
+        if '[' not in line: # Cheap literal prescreen, every format needs one
+            if line.strip():
+                carry = line.strip()
+            continue
+        match = _COMBINED.match(line)
+        if match is None:
+            carry = line.strip()
+            continue
+        rank, key_g, reg_g, val_g, unit_g, handler = _ALTERNATIVES[match.lastgroup]
+        key_desc = match.group(key_g).strip() or carry
+        carry = ""
+        if card_type_hex is None:
+            header = _CARD_TYPE_HEADER.search(line)
+            if header:
+                card_type_hex = header.group(1)
+                in_card_type = True
+        register = match.group(reg_g).strip()
+        if ranks.get(register, rank + 1) <= rank:
+            continue
+        ranks[register] = rank
+        fields = handler(match.group(val_g).strip(),
+                         match.group(unit_g) if unit_g else None)
+        data[register] = {'key': key_desc, **fields}
+
+    # Apply the Card Type multi-line block
+    if card_type_hex is not None and supported_types:
         register_name = 'CARD_TYPE'
-        hex_val = match5.group(1)
-        supported_types = [line.strip() for line in
-                           match5.group(2).strip().split('\n') if line.strip()]
+        hex_val = card_type_hex
         if register_name in data:
             data[register_name]['supported_types'] = supported_types
         else:
@@ -242,20 +378,24 @@ def calculate_capacity(sec_count: Optional[int]) -> Tuple[str, str]:
     gibibytes = total_bytes / (1024**3)
     return f"{gigabytes:.2f} GB", f"{gibibytes:.2f} GiB"
 
+# (threshold, reciprocal, unit) from largest to smallest; the reciprocals
+# are exact powers of two, so multiplying gives the same result as dividing
+_BYTE_UNITS: Tuple[Tuple[int, float, str], ...] = (
+    (1 << 30, 1 / (1 << 30), "GiB"),
+    (1 << 20, 1 / (1 << 20), "MiB"),
+    (1 << 10, 1 / (1 << 10), "KiB"),
+)
+
 def format_bytes(bytes_val: Optional[Union[int, float]]) -> str:
     """Formats bytes into KiB, MiB, GiB."""
     if not isinstance(bytes_val, (int, float)) or bytes_val < 0:
         return "N/A"
     if bytes_val == 0:
         return "0 Bytes"
-    if bytes_val < 1024:
-        return f"{bytes_val} Bytes"
-    if bytes_val < 1024**2:
-        return f"{bytes_val / 1024:.1f} KiB"
-    if bytes_val < 1024**3:
-        return f"{bytes_val / (1024**2):.1f} MiB"
-    # else
-    return f"{bytes_val / (1024**3):.1f} GiB"
+    for threshold, inverse, unit in _BYTE_UNITS:
+        if bytes_val >= threshold:
+            return f"{bytes_val * inverse:.1f} {unit}"
+    return f"{bytes_val} Bytes"
 
 def get_val(data: ExtCsdData, key: str, field: str = 'int',
             default: Any = None) -> Any:
@@ -266,183 +406,232 @@ def get_key(data: ExtCsdData, key: str, default: str = "N/A") -> str:
     """Safely get the descriptive key name associated with a register."""
     return data.get(key, {}).get('key', default)
 
-def _print_aligned(key: str, value: str, width: int) -> None:
-    """Prints a key-value pair with alignment."""
-    print(f"  {key:<{width}} : {value}")
-
-def _assess_health(data: ExtCsdData) -> Tuple[str, Optional[int], Optional[int], Optional[int]]:
-    """Assesses eMMC health and returns summary and raw values."""
+def _extract(data: ExtCsdData,
+             spec: Sequence[Tuple[str, str, Any]]) -> Tuple[Any, ...]:
+    """Reads several (register, field, default) values in a single pass."""
+    empty: Dict[str, Any] = {}
+    return tuple(data.get(key, empty).get(field, default)
+                 for key, field, default in spec)
+
+def _iter_set_bits(value: int) -> Iterator[int]:
+    """Yields each set bit of value as a mask, lowest first."""
+    while value:
+        lsb = value & -value
+        yield lsb
+        value ^= lsb
+
+def _fmt_aligned(key: str, value: str, width: int) -> str:
+    """Formats a key-value pair with alignment."""
+    return f"  {key:<{width}} : {value}"
+
+def _write_lines(lines: List[str]) -> None:
+    """Writes a report section to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Health severity levels returned by _assess_health()
+SEVERITY_OK = 0
+SEVERITY_WARN = 1
+SEVERITY_CRITICAL = 2
+
+def _assess_health(data: ExtCsdData) -> Tuple[str, int, Optional[int], Optional[int], Optional[int]]:
+    """Assesses eMMC health and returns summary, severity and raw values."""
     life_a_val = get_val(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_A')
     life_b_val = get_val(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_B')
     pre_eol_val = get_val(data, 'EXT_CSD_PRE_EOL_INFO')
 
     health_summary = _col("Excellent", C_GREEN) # Default optimistic
+    severity = SEVERITY_OK
     if pre_eol_val == 0x03:
         health_summary = _col("Urgent (Near/At EOL)", C_RED + C_BOLD)
+        severity = SEVERITY_CRITICAL
     elif pre_eol_val == 0x02:
         health_summary = _col("Warning (Approaching EOL)", C_YELLOW)
+        severity = SEVERITY_WARN
     elif (life_a_val is not None and life_a_val >= 0x0B) or \
          (life_b_val is not None and life_b_val >= 0x0B):
         health_summary = _col("Critical (Exceeded Lifetime)", C_RED + C_BOLD)
+        severity = SEVERITY_CRITICAL
     elif (life_a_val is not None and life_a_val >= 0x09) or \
          (life_b_val is not None and life_b_val >= 0x09):
         health_summary = _col("High Wear (80%+ used)", C_RED)
+        severity = SEVERITY_CRITICAL
     elif (life_a_val is not None and life_a_val >= 0x06) or \
          (life_b_val is not None and life_b_val >= 0x06):
         health_summary = _col("Moderate Wear (50%+ used)", C_YELLOW)
+        severity = SEVERITY_WARN
     elif life_a_val is None and life_b_val is None and pre_eol_val is None:
         health_summary = _col("Unknown (Health info not available)", C_MAGENTA)
 
-    return health_summary, life_a_val, life_b_val, pre_eol_val
+    return health_summary, severity, life_a_val, life_b_val, pre_eol_val
 
-def _print_health_report(data: ExtCsdData, width: int) -> str:
+def _print_health_report(data: ExtCsdData, width: int) -> int:
     """Prints the health assessment section."""
-    print("\n--- Health Assessment ---")
-    health_summary, life_a_val, life_b_val, pre_eol_val = _assess_health(data)
+    lines: List[str] = []
+    lines.append("\n--- Health Assessment ---")
+    health_summary, severity, life_a_val, life_b_val, pre_eol_val = _assess_health(data)
 
-    life_a_desc = LIFE_TIME_MAP.get(life_a_val, _col("Unknown", C_MAGENTA))
-    life_b_desc = LIFE_TIME_MAP.get(life_b_val, _col("Unknown", C_MAGENTA))
-    pre_eol_desc = PRE_EOL_MAP.get(pre_eol_val, _col("Unknown", C_MAGENTA))
+    life_a_desc = LIFE_TIME_MAP.get(life_a_val, _UNKNOWN_M)
+    life_b_desc = LIFE_TIME_MAP.get(life_b_val, _UNKNOWN_M)
+    pre_eol_desc = PRE_EOL_MAP.get(pre_eol_val, _UNKNOWN_M)
 
     life_a_hex = f"0x{life_a_val:02X}" if life_a_val is not None else "N/A"
     life_b_hex = f"0x{life_b_val:02X}" if life_b_val is not None else "N/A"
     pre_eol_hex = f"0x{pre_eol_val:02X}" if pre_eol_val is not None else "N/A"
 
-    _print_aligned(get_key(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_A', 'Life Time Est. A'),
-                   f"{life_a_desc} [{life_a_hex}]", width)
-    _print_aligned(get_key(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_B', 'Life Time Est. B'),
-                   f"{life_b_desc} [{life_b_hex}]", width)
-    _print_aligned(get_key(data, 'EXT_CSD_PRE_EOL_INFO', 'Pre EOL Info'),
-                   f"{pre_eol_desc} [{pre_eol_hex}]", width)
+    lines.append(_fmt_aligned(get_key(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_A', 'Life Time Est. A'),
+                              f"{life_a_desc} [{life_a_hex}]", width))
+    lines.append(_fmt_aligned(get_key(data, 'EXT_CSD_DEVICE_LIFE_TIME_EST_TYP_B', 'Life Time Est. B'),
+                              f"{life_b_desc} [{life_b_hex}]", width))
+    lines.append(_fmt_aligned(get_key(data, 'EXT_CSD_PRE_EOL_INFO', 'Pre EOL Info'),
+                              f"{pre_eol_desc} [{pre_eol_hex}]", width))
 
-    print(f"\n  {_col('Overall Health Summary', C_BOLD):<{width+2}} : {health_summary}")
-    return health_summary # Return assessed summary for recommendations
+    lines.append(f"\n  {_col('Overall Health Summary', C_BOLD):<{width+2}} : {health_summary}")
+    _write_lines(lines)
+    return severity # Return assessed severity for recommendations
 
-def _print_device_info(data: ExtCsdData, raw_output: str, width: int) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[int]]:
+def _print_device_info(data: ExtCsdData, raw_output: str, width: int) -> Tuple[bool, bool, Optional[int], Optional[str], Optional[int]]:
     """Prints the device information section and returns key values for recommendations."""
-    print("\n--- Device Information ---")
-    rev_match = re.search(r"Extended CSD rev (\d\.\d) \(MMC (.*?)\)", raw_output)
-    csd_rev = rev_match.group(1) if rev_match else "Unknown"
-    mmc_spec = rev_match.group(2) if rev_match else "Unknown"
-    _print_aligned("eMMC Standard", f"MMC {mmc_spec} (CSD Rev {csd_rev})", width)
+    lines: List[str] = []
+    lines.append("\n--- Device Information ---")
+    (sec_count, cache_str, cache_num, trim_mult_val, bkops_support_val,
+     bkops_status_val, cmdq_support_val, cmdq_depth_val, cmdq_enabled_val,
+     wr_rel_param, power_off_notify, boot_mult, rpmb_mult, partition_support,
+     partition_completed, card_type_hex, supported_types,
+     card_type_int) = _extract(data, _DEVICE_INFO_FIELDS)
+
+    # Fixed-format line, e.g. "Extended CSD rev 1.8 (MMC 5.1)"; sliced by hand
+    csd_rev = mmc_spec = "Unknown"
+    rev_start = raw_output.find("Extended CSD rev ")
+    if rev_start >= 0:
+        rev_end = raw_output.find("\n", rev_start)
+        rev_line = raw_output[rev_start + 17:rev_end if rev_end >= 0 else None]
+        rev, sep, rest = rev_line.partition(" (MMC ")
+        spec_end = rest.find(")")
+        if sep and spec_end >= 0:
+            csd_rev = rev
+            mmc_spec = rest[:spec_end]
+    lines.append(_fmt_aligned("eMMC Standard", f"MMC {mmc_spec} (CSD Rev {csd_rev})", width))
 
-    sec_count = get_val(data, 'SEC_COUNT')
     cap_gb, cap_gib = calculate_capacity(sec_count)
     sec_count_str = str(sec_count) if sec_count is not None else 'N/A'
-    _print_aligned("Capacity", f"{cap_gb} / {cap_gib} ({sec_count_str} sectors)", width)
+    lines.append(_fmt_aligned("Capacity", f"{cap_gb} / {cap_gib} ({sec_count_str} sectors)", width))
 
-    cache_str = get_val(data, 'CACHE_SIZE', field='str', default="Unknown")
-    cache_num = get_val(data, 'CACHE_SIZE', field='num')
     cache_detail = cache_str
     if cache_num is not None:
         cache_detail += f" ({format_bytes(cache_num * 1024)})"
-    _print_aligned("Cache Size", cache_detail, width)
+    lines.append(_fmt_aligned("Cache Size", cache_detail, width))
 
-    trim_mult_val = get_val(data, 'TRIM_MULT')
-    trim_support = _col("Yes", C_GREEN) if trim_mult_val is not None and trim_mult_val > 0 else _col("No / Unknown", C_YELLOW)
-    _print_aligned("TRIM Support", trim_support, width)
+    trim_support = _YES_G if trim_mult_val is not None and trim_mult_val > 0 else _col("No / Unknown", C_YELLOW)
+    lines.append(_fmt_aligned("TRIM Support", trim_support, width))
 
-    bkops_support_val = get_val(data, 'BKOPS_SUPPORT')
-    bkops_status_val = get_val(data, 'BKOPS_STATUS')
-    bkops_support_str = _col("Supported", C_GREEN) if bkops_support_val == 1 else _col("Not Supported / Unknown", C_YELLOW)
+    bkops_support_str = _SUPPORTED_G if bkops_support_val == 1 else _NOT_SUPPORTED_Y
     bkops_status_str = BKOPS_STATUS_MAP.get(bkops_status_val,
                                             _col(f"Vendor Specific Status {bkops_status_val}", C_YELLOW)
-                                            if bkops_status_val is not None else _col("Unknown", C_MAGENTA))
-    _print_aligned("Background Ops (BKOPS)", bkops_support_str, width)
+                                            if bkops_status_val is not None else _UNKNOWN_M)
+    lines.append(_fmt_aligned("Background Ops (BKOPS)", bkops_support_str, width))
     if bkops_support_val == 1:
-        _print_aligned("  BKOPS Status", bkops_status_str, width - 2) # Indent status
+        lines.append(_fmt_aligned("  BKOPS Status", bkops_status_str, width - 2)) # Indent status
 
-    cmdq_support_val = get_val(data, 'CMDQ_SUPPORT')
-    cmdq_support_str = _col("Supported", C_GREEN) if cmdq_support_val == 1 else _col("Not Supported / Unknown", C_YELLOW)
-    _print_aligned("Command Queuing (CMDQ)", cmdq_support_str, width)
+    cmdq_support_str = _SUPPORTED_G if cmdq_support_val == 1 else _NOT_SUPPORTED_Y
+    lines.append(_fmt_aligned("Command Queuing (CMDQ)", cmdq_support_str, width))
     cmdq_en_path: Optional[str] = None
     if cmdq_support_val == 1:
-        cmdq_depth_val = get_val(data, 'CMDQ_DEPTH')
-        cmdq_enabled_val = get_val(data, 'CMDQ_MODE_EN')
         depth_str = str(cmdq_depth_val) if cmdq_depth_val is not None else "Unknown"
-        enabled_str = _col("Yes", C_GREEN) if cmdq_enabled_val == 1 else _col("No", C_YELLOW)
-        _print_aligned("  CMDQ Depth", depth_str, width - 2)
-        _print_aligned("  CMDQ Enabled (FW level)", f"{enabled_str} (Note: OS may override)", width - 2)
+        enabled_str = _YES_G if cmdq_enabled_val == 1 else _NO_Y
+        lines.append(_fmt_aligned("  CMDQ Depth", depth_str, width - 2))
+        lines.append(_fmt_aligned("  CMDQ Enabled (FW level)", f"{enabled_str} (Note: OS may override)", width - 2))
         cmdq_en_path = _find_cmdq_sysfs_path(os.path.basename(args.device_path)) # Pass device base name
 
-    wr_rel_param = get_val(data,'WR_REL_PARAM')
     reliable_write = _col("Enhanced", C_GREEN) if wr_rel_param is not None and (wr_rel_param & 0x01) else _col("Basic / Unknown", C_YELLOW)
-    _print_aligned("Reliable Write Support", reliable_write, width)
+    lines.append(_fmt_aligned("Reliable Write Support", reliable_write, width))
 
-    power_off_notify = get_val(data, 'POWER_OFF_NOTIFICATION')
-    power_notify_str = _col("Enabled", C_GREEN) if power_off_notify == 1 else _col("Disabled / Unknown", C_YELLOW)
-    _print_aligned("Power Off Notify (Ctrl)", power_notify_str, width)
+    power_notify_str = _ENABLED_G if power_off_notify == 1 else _col("Disabled / Unknown", C_YELLOW)
+    lines.append(_fmt_aligned("Power Off Notify (Ctrl)", power_notify_str, width))
 
-    boot_mult = get_val(data, 'BOOT_SIZE_MULTI')
     if boot_mult is not None:
         boot_size_kib = boot_mult * 128
-        _print_aligned("Boot Partition Size",
-                       f"{format_bytes(boot_size_kib * 1024)} (Typically x2)", width)
-    rpmb_mult = get_val(data, 'RPMB_SIZE_MULT')
+        lines.append(_fmt_aligned("Boot Partition Size",
+                                  f"{format_bytes(boot_size_kib * 1024)} (Typically x2)", width))
     if rpmb_mult is not None:
         rpmb_size_kib = rpmb_mult * 128
-        _print_aligned("RPMB Size", format_bytes(rpmb_size_kib * 1024), width)
+        lines.append(_fmt_aligned("RPMB Size", format_bytes(rpmb_size_kib * 1024), width))
 
-    partition_support = get_val(data, 'PARTITIONING_SUPPORT')
-    partition_support_str = _col("Yes", C_GREEN) if partition_support is not None and (partition_support & 0x01) else "No"
-    _print_aligned("Partitioning Support", partition_support_str, width)
+    partition_support_str = _YES_G if partition_support is not None and (partition_support & 0x01) else "No"
+    lines.append(_fmt_aligned("Partitioning Support", partition_support_str, width))
     if partition_support is not None and (partition_support & 0x01):
-        partition_completed = get_val(data, 'PARTITION_SETTING_COMPLETED')
-        enh_attr = _col("Yes", C_GREEN) if (partition_support & 0x02) else "No"
-        completed = _col("Yes", C_GREEN) if partition_completed == 1 else _col("No", C_YELLOW)
-        _print_aligned("  Enhanced Attributes", enh_attr, width - 2)
-        _print_aligned("  Partitioning Completed", completed, width - 2)
+        enh_attr = _YES_G if (partition_support & 0x02) else "No"
+        completed = _YES_G if partition_completed == 1 else _NO_Y
+        lines.append(_fmt_aligned("  Enhanced Attributes", enh_attr, width - 2))
+        lines.append(_fmt_aligned("  Partitioning Completed", completed, width - 2))
 
     # Decode Card Type
-    card_type_hex = get_val(data, 'CARD_TYPE', 'hex', 'N/A')
-    _print_aligned("Supported Interface Modes", f"[{get_key(data, 'CARD_TYPE')}: {card_type_hex}]", width)
-    supported_types: Optional[List[str]] = get_val(data, 'CARD_TYPE', 'supported_types')
-    card_type_int: Optional[int] = get_val(data, 'CARD_TYPE', 'int')
+    lines.append(_fmt_aligned("Supported Interface Modes", f"[{get_key(data, 'CARD_TYPE')}: {card_type_hex}]", width))
 
     if supported_types:
         for type_desc in supported_types:
-            if type_desc: print(f"    - {type_desc}")
+            if type_desc: lines.append(f"    - {type_desc}")
     elif card_type_int is not None:
-        for bit, desc in CARD_TYPE_MAP.items():
-            if card_type_int & bit: print(f"    - {desc}")
+        for bit in _iter_set_bits(card_type_int):
+            desc = CARD_TYPE_MAP.get(bit)
+            if desc: lines.append(f"    - {desc}")
     else:
-        print("    - Could not determine supported modes.")
+        lines.append("    - Could not determine supported modes.")
+
+    _write_lines(lines)
 
-    return card_type_int, cmdq_support_val, cmdq_en_path, trim_mult_val
+    # HS400 is bits 6-7 (0xC0), HS200 is bits 4-5 (0x30)
+    hs400_support = card_type_int is not None and bool(card_type_int & 0xC0)
+    hs200_support = card_type_int is not None and bool(card_type_int & 0x30)
+    return hs400_support, hs200_support, cmdq_support_val, cmdq_en_path, trim_mult_val
 
 
+_MMC_HOST_CLASS = "/sys/class/mmc_host"
+
+def _scan_host_cmdq(mmc_host_num: str) -> Optional[str]:
+    """Returns the first <host>/<host>:XXXX/cmdq_en under an mmc host, if any."""
+    prefix = f"{mmc_host_num}:"
+    try:
+        with os.scandir(os.path.join(_MMC_HOST_CLASS, mmc_host_num)) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix):
+                    candidate = os.path.join(entry.path, "cmdq_en")
+                    if os.path.exists(candidate):
+                        return candidate
+    except OSError:
+        pass # Host directory missing or unreadable
+    return None
+
+@functools.lru_cache(maxsize=8)
 def _find_cmdq_sysfs_path(dev_basename: str) -> Optional[str]:
     """Attempts to find the cmdq_en sysfs path for the device."""
-    cmdq_en_path: Optional[str] = None
-    # Use more specific glob pattern if possible, fallback is wider
-    cmdq_path_pattern = f"/sys/class/block/{dev_basename}/device/cmdq_en"
-    potential_paths = glob.glob(cmdq_path_pattern)
-
-    if not potential_paths: # Fallback if direct path doesn't exist
-         # Try finding via host (less reliable matching)
-        cmdq_path_pattern = "/sys/devices/platform/*/mmc_host/mmc?/mmc?:????/cmdq_en"
-        potential_paths = glob.glob(cmdq_path_pattern)
-        mmc_host_num = None
-        try: # Find mmc host number (e.g., mmc0 from mmcblk0)
-            link_path = os.readlink(f"/sys/class/block/{dev_basename}")
-            # Example link: ../../devices/platform/fe2e0000.mmc/mmc_host/mmc0/mmc0:0001/block/mmcblk0
-            mmc_host_num = link_path.split('/')[4] # e.g., mmc0 based on example
-        except OSError:
-            pass # Ignore if cannot read link or parse
-
-        if mmc_host_num:
-            for path in potential_paths:
-                # Check if the path contains the likely host identifier
-                if f"/{mmc_host_num}/" in path:
-                    cmdq_en_path = path
-                    break # Take the first match for this host
-        elif potential_paths:
-            cmdq_en_path = potential_paths[0] # Fallback: take the first found globally
-
-    elif potential_paths: # Direct path found
-        cmdq_en_path = potential_paths[0]
-
-    return cmdq_en_path
+    # Direct path is the common case and needs no directory scan
+    direct_path = f"/sys/class/block/{dev_basename}/device/cmdq_en"
+    if os.path.exists(direct_path):
+        return direct_path
+
+    # Fallback if direct path doesn't exist: look under the device's mmc host
+    mmc_host_num = None
+    try: # Find mmc host number (e.g., mmc0 from mmcblk0)
+        link_path = os.readlink(f"/sys/class/block/{dev_basename}")
+        # Example link: ../../devices/platform/fe2e0000.mmc/mmc_host/mmc0/mmc0:0001/block/mmcblk0
+        parts = link_path.split('/')
+        mmc_host_num = parts[parts.index('mmc_host') + 1] # e.g., mmc0
+    except (OSError, ValueError, IndexError):
+        pass # Ignore if cannot read link or parse
+
+    if mmc_host_num:
+        return _scan_host_cmdq(mmc_host_num)
+
+    # Last resort (less reliable): take the first cmdq_en found on any host
+    try:
+        hosts = sorted(entry.name for entry in os.scandir(_MMC_HOST_CLASS))
+    except OSError:
+        return None
+    for host in hosts:
+        cmdq_en_path = _scan_host_cmdq(host)
+        if cmdq_en_path:
+            return cmdq_en_path
+    return None
 
 def _check_cmdq_runtime_status(cmdq_en_path: Optional[str]) -> str:
     """Checks the runtime status of CMDQ via sysfs."""
@@ -450,41 +639,40 @@ def _check_cmdq_runtime_status(cmdq_en_path: Optional[str]) -> str:
         try:
             with open(cmdq_en_path, 'r', encoding='utf-8') as f_handle:
                 status = f_handle.read().strip()
-                return _col("Enabled", C_GREEN) if status == "1" else _col("Disabled", C_YELLOW)
+                return _ENABLED_G if status == "1" else _col("Disabled", C_YELLOW)
         except (IOError, OSError) as io_err:
             return _col(f"Error checking sysfs ({type(io_err).__name__})", C_RED)
     else:
         return _col("Unknown (sysfs path not found/verified)", C_MAGENTA)
 
 def _print_recommendations(
-    health_summary: str,
-    card_type_int: Optional[int],
+    severity: int,
+    hs400_support: bool,
+    hs200_support: bool,
     cmdq_support_val: Optional[int],
     cmdq_en_path: Optional[str],
     trim_mult_val: Optional[int]
 ) -> None:
     """Prints recommendations based on analyzed data."""
-    print("\n--- Recommendations for Longevity and Performance ---")
-    print("  1. Monitor Health: Periodically re-run this script check health status.")
-    # Check if health summary contains specific color codes indicating non-optimal
-    if C_YELLOW in health_summary or C_RED in health_summary:
-        print(_col("     -> Status is non-optimal; monitor more frequently.", C_YELLOW))
-    print("  2. Maintain Free Space: Ideally keep 15-20%+ free space for wear "
-          "leveling & performance.")
+    lines: List[str] = []
+    lines.append("\n--- Recommendations for Longevity and Performance ---")
+    lines.append("  1. Monitor Health: Periodically re-run this script check health status.")
+    if severity > SEVERITY_OK:
+        lines.append(_col("     -> Status is non-optimal; monitor more frequently.", C_YELLOW))
+    lines.append("  2. Maintain Free Space: Ideally keep 15-20%+ free space for wear "
+                 "leveling & performance.")
 
     if trim_mult_val is not None and trim_mult_val > 0:
-        print(_col("  3. Ensure TRIM is Active: Verify OS uses TRIM/DISCARD (e.g., "
-                   "`sudo fstrim -v /`).", C_GREEN))
+        lines.append(_col("  3. Ensure TRIM is Active: Verify OS uses TRIM/DISCARD (e.g., "
+                          "`sudo fstrim -v /`).", C_GREEN))
     else:
-        print(_col("  3. TRIM Not Supported/Enabled: Performance/longevity may degrade "
-                   "without TRIM.", C_YELLOW))
+        lines.append(_col("  3. TRIM Not Supported/Enabled: Performance/longevity may degrade "
+                          "without TRIM.", C_YELLOW))
 
-    print("  4. Minimize Unnecessary Writes: Review logging levels, use tmpfs for "
-          "/tmp if RAM allows.")
-    print("  5. Stable Power Supply: Use a quality PSU and ensure clean shutdowns.")
+    lines.append("  4. Minimize Unnecessary Writes: Review logging levels, use tmpfs for "
+                 "/tmp if RAM allows.")
+    lines.append("  5. Stable Power Supply: Use a quality PSU and ensure clean shutdowns.")
 
-    hs400_support = card_type_int is not None and (card_type_int & (1<<6) or card_type_int & (1<<7))
-    hs200_support = card_type_int is not None and (card_type_int & (1<<4) or card_type_int & (1<<5))
     rec6 = "  6. Check Interface Speed: Verify optimal interface speed is used"
     if hs400_support:
         rec6 += _col(" (Ensure host uses HS400 mode).", C_GREEN)
@@ -493,29 +681,30 @@ def _print_recommendations(
     else:
         rec6 += "." # Generic message if specific high speed not detected
     rec6 += " Check with `dmesg | grep -i 'mmc.*timing'`."
-    print(rec6)
+    lines.append(rec6)
 
     if cmdq_support_val == 1:
         cmdq_runtime_status = _check_cmdq_runtime_status(cmdq_en_path)
-        print(f"  7. Command Queuing (CMDQ): Supported. Runtime status: {cmdq_runtime_status}.")
+        lines.append(f"  7. Command Queuing (CMDQ): Supported. Runtime status: {cmdq_runtime_status}.")
         sysfs_path_str = cmdq_en_path if cmdq_en_path else 'N/A'
-        print("     -> If random I/O is slow, investigate enabling via OS "
-              f"(sysfs path: {sysfs_path_str}).")
-        if cmdq_runtime_status != _col("Enabled", C_GREEN) and cmdq_en_path:
+        lines.append("     -> If random I/O is slow, investigate enabling via OS "
+                     f"(sysfs path: {sysfs_path_str}).")
+        if cmdq_runtime_status != _ENABLED_G and cmdq_en_path:
             # Provide safe command example
             tee_cmd = f"echo 1 | sudo tee {cmdq_en_path}"
-            print(_col("     -> To enable (use with caution, requires root): "
-                       f"{tee_cmd}", C_CYAN))
+            lines.append(_col("     -> To enable (use with caution, requires root): "
+                              f"{tee_cmd}", C_CYAN))
 
-    print("  8. Filesystem: Use flash-aware filesystems (F2FS) or ensure EXT4 uses "
-          "TRIM/discard.")
-    print("  9. System Updates: Keep kernel/OS updated for potential driver "
-          "improvements.")
+    lines.append("  8. Filesystem: Use flash-aware filesystems (F2FS) or ensure EXT4 uses "
+                 "TRIM/discard.")
+    lines.append("  9. System Updates: Keep kernel/OS updated for potential driver "
+                 "improvements.")
+    _write_lines(lines)
 
 
 # --- Main Execution ---
 
-def main(device_path: str) -> None:
+def main(device_path: str, cache_ttl: int = 0, refresh: bool = False) -> None:
     """Main function to analyze eMMC and print report."""
     if os.geteuid() != 0:
         print(_col("Error: This script requires root privileges to run the "
@@ -523,19 +712,20 @@ def main(device_path: str) -> None:
         print(_col("Please run using 'sudo'.", C_RED), file=sys.stderr)
         sys.exit(1)
 
+    _build_labels()
     print(f"--- Analyzing eMMC device: {_col(device_path, C_BLUE)} ---")
-    raw_output = run_mmc_command(device_path)
+    raw_output = run_mmc_command(device_path, cache_ttl, refresh)
     data = parse_extcsd_output(raw_output)
 
     # Determine alignment width (optional, can use fixed width)
     # Example: fixed width for better consistency
     key_width = 28
 
-    health_summary = _print_health_report(data, key_width)
-    card_type_int, cmdq_support_val, cmdq_en_path, trim_mult_val = \
+    severity = _print_health_report(data, key_width)
+    hs400_support, hs200_support, cmdq_support_val, cmdq_en_path, trim_mult_val = \
         _print_device_info(data, raw_output, key_width)
-    _print_recommendations(health_summary, card_type_int, cmdq_support_val,
-                          cmdq_en_path, trim_mult_val)
+    _print_recommendations(severity, hs400_support, hs200_support,
+                           cmdq_support_val, cmdq_en_path, trim_mult_val)
 
 
 if __name__ == "__main__":
@@ -555,11 +745,25 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable colorized output."
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=0,
+        metavar="SECONDS",
+        help="Reuse cached 'mmc extcsd read' output for this many seconds\n"
+             "(default: %(default)s, caching disabled)."
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached output and re-read the device."
+    )
 
     args = parser.parse_args()
 
     if args.no_color:
         COLOR_ENABLED = False # Override TTY check
+        _col = _col_off
 
     # --- Device Path Validation ---
     selected_device = args.device_path
@@ -582,4 +786,4 @@ if __name__ == "__main__":
     # Update args.device_path if an alternative was found and used
     args.device_path = selected_device
 
-    main(args.device_path)
+    main(args.device_path, args.cache_ttl, args.refresh)
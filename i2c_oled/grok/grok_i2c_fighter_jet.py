@@ -6,97 +6,164 @@
 # Down arrow - move down
 # Space - shoot
 
-import curses
+import array
+import fcntl
+import os
+import sys
+import termios
 import time
+import tty
 import random
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw
+
+
+def swap_pop(xs, i):
+    """Remove xs[i] in O(1) by moving the last element into its place."""
+    xs[i] = xs[-1]
+    xs.pop()
 
 # Initialize the OLED display (I2C port 8, address 0x3C)
 serial = i2c(port=8, address=0x3C)
 device = ssd1306(serial, width=128, height=32)
 
-# Initialize curses for keyboard input
-stdscr = curses.initscr()
-curses.cbreak()
-stdscr.keypad(True)
-stdscr.nodelay(True)  # Non-blocking input
+# Persistent frame buffer, redrawn and sent to the display every frame
+frame = Image.new(device.mode, device.size)
+draw = ImageDraw.Draw(frame)
+
+# Put the terminal in cbreak mode with non-blocking reads for keyboard input
+KEY_UP = b'\x1b[A'
+KEY_DOWN = b'\x1b[B'
+stdin_fd = sys.stdin.fileno()
+old_term = termios.tcgetattr(stdin_fd)
+old_flags = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
+tty.setcbreak(stdin_fd)
+fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
 
 # Game variables
 jet_slot = 1  # Start in the middle slot (0, 1, 2)
-rockets = []  # List of (x, slot) for rockets
-bullets = []  # List of (x, slot) for bullets
+# Rockets and bullets are bucketed by slot; each bucket holds x positions.
+# Only entities sharing a slot can collide, so collisions are checked per slot.
+rockets_by_slot = [array.array('i') for _ in range(3)]
+bullets_by_slot = [array.array('i') for _ in range(3)]
 game_over = False
 frame_count = 0
+FRAME_TIME = 0.05  # 20 FPS
+
+# Rocket spawn slots are drawn in batches and consumed in order
+SLOT_BUFFER_SIZE = 1024
+slot_buf = random.choices((0, 1, 2), k=SLOT_BUFFER_SIZE)
+slot_i = 0
 
 try:
+    deadline = time.monotonic()
     while not game_over:
-        # Handle user input
-        key = stdscr.getch()
-        if key == curses.KEY_UP and jet_slot > 0:
-            jet_slot -= 1  # Move jet up
-        elif key == curses.KEY_DOWN and jet_slot < 2:
-            jet_slot += 1  # Move jet down
-        elif key == ord(' '):
-            # Shoot a bullet from the jet's position
-            bullets.append((12, jet_slot))
+        # Handle user input (arrow keys arrive as 3-byte escape sequences)
+        try:
+            keys = os.read(stdin_fd, 8)
+        except BlockingIOError:
+            keys = b''
+        pos = 0
+        while pos < len(keys):
+            if keys.startswith(KEY_UP, pos):
+                if jet_slot > 0:
+                    jet_slot -= 1  # Move jet up
+                pos += len(KEY_UP)
+            elif keys.startswith(KEY_DOWN, pos):
+                if jet_slot < 2:
+                    jet_slot += 1  # Move jet down
+                pos += len(KEY_DOWN)
+            else:
+                if keys[pos] == ord(' '):
+                    # Shoot a bullet from the jet's position
+                    bullets_by_slot[jet_slot].append(12)
+                pos += 1
 
         # Move rockets left by 2 pixels
-        for i in range(len(rockets)):
-            rockets[i] = (rockets[i][0] - 2, rockets[i][1])
+        for xs in rockets_by_slot:
+            for i in range(len(xs)):
+                xs[i] -= 2
         
         # Move bullets right by 4 pixels
-        for i in range(len(bullets)):
-            bullets[i] = (bullets[i][0] + 4, bullets[i][1])
+        for xs in bullets_by_slot:
+            for i in range(len(xs)):
+                xs[i] += 4
         
-        # Remove off-screen rockets and bullets
-        rockets = [r for r in rockets if r[0] + 3 >= 0]
-        bullets = [b for b in bullets if b[0] <= 127]
+        # Remove off-screen rockets and bullets (from the tail, in place)
+        for xs in rockets_by_slot:
+            for i in range(len(xs) - 1, -1, -1):
+                if xs[i] + 3 < 0:
+                    swap_pop(xs, i)
+        for xs in bullets_by_slot:
+            for i in range(len(xs) - 1, -1, -1):
+                if xs[i] > 127:
+                    swap_pop(xs, i)
         
         # Spawn new rockets every 20 frames
         if frame_count % 20 == 0:
-            slot = random.randint(0, 2)
-            rockets.append((127, slot))
+            if slot_i == SLOT_BUFFER_SIZE:
+                slot_buf = random.choices((0, 1, 2), k=SLOT_BUFFER_SIZE)
+                slot_i = 0
+            slot = slot_buf[slot_i]
+            slot_i += 1
+            rockets_by_slot[slot].append(127)
         
         # Check for bullet-rocket collisions
-        for bullet in bullets[:]:
-            for rocket in rockets[:]:
-                if bullet[1] == rocket[1] and bullet[0] >= rocket[0] and bullet[0] <= rocket[0] + 3:
-                    bullets.remove(bullet)
-                    rockets.remove(rocket)
-                    break  # One bullet hits one rocket
+        for slot in range(3):
+            bxs = bullets_by_slot[slot]
+            rxs = rockets_by_slot[slot]
+            # Walk both buckets from the tail: swap_pop only moves already
+            # visited entries, so no copies are needed while removing
+            for bi in range(len(bxs) - 1, -1, -1):
+                bx = bxs[bi]
+                for ri in range(len(rxs) - 1, -1, -1):
+                    if rxs[ri] <= bx <= rxs[ri] + 3:
+                        swap_pop(bxs, bi)
+                        swap_pop(rxs, ri)
+                        break  # One bullet hits one rocket
         
         # Check for rocket-jet collisions
-        for rocket in rockets:
-            if rocket[1] == jet_slot and rocket[0] <= 11:
+        for x in rockets_by_slot[jet_slot]:
+            if x <= 11:
                 game_over = True
                 break
         
         # Render the scene
-        with canvas(device) as draw:
-            # Draw the jet (12x4 rectangle)
-            jet_y = jet_slot * 8
-            draw.rectangle((0, jet_y + 2, 11, jet_y + 5), fill="white")
-            
-            # Draw bullets (2x1 rectangles)
-            for x, slot in bullets:
-                y = slot * 8 + 3
+        draw.rectangle(device.bounding_box, fill="black")  # Clear the frame
+
+        # Draw the jet (12x4 rectangle)
+        jet_y = jet_slot * 8
+        draw.rectangle((0, jet_y + 2, 11, jet_y + 5), fill="white")
+        
+        # Draw bullets (2x1 rectangles)
+        for slot, xs in enumerate(bullets_by_slot):
+            y = slot * 8 + 3
+            for x in xs:
                 draw.rectangle((x, y, x + 1, y), fill="white")
-            
-            # Draw rockets (4x8 rectangles)
-            for x, slot in rockets:
-                y = slot * 8
+        
+        # Draw rockets (4x8 rectangles)
+        for slot, xs in enumerate(rockets_by_slot):
+            y = slot * 8
+            for x in xs:
                 draw.rectangle((x, y, x + 3, y + 7), fill="white")
         
+        device.display(frame)
+        
         # Increment frame counter
         frame_count += 1
         
-        # Control frame rate (20 FPS)
-        time.sleep(0.05)
+        # Control frame rate: sleep until the next frame deadline, and
+        # resync instead of bursting if the frame overran it
+        deadline += FRAME_TIME
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            deadline = time.monotonic()
 
 finally:
     # Clean up
-    curses.endwin()  # Restore terminal
-    with canvas(device) as draw:
-        draw.rectangle(device.bounding_box, fill="black")  # Clear display
+    fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags)
+    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)  # Restore terminal
+    device.clear()  # Clear display
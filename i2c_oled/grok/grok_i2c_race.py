@@ -5,22 +5,34 @@
 # up arrow - move up
 # down arrow - move down
 
-import curses
+import fcntl
+import os
+import sys
+import termios
 import time
+import tty
 import random
+import numpy as np
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw
 
 # Initialize the OLED display (I2C port 8, address 0x3C)
 serial = i2c(port=8, address=0x3C)
 device = ssd1306(serial, width=128, height=32)
 
-# Initialize curses for keyboard input
-stdscr = curses.initscr()
-curses.cbreak()
-stdscr.keypad(True)
-stdscr.nodelay(True)  # Non-blocking input
+# Persistent frame buffer, redrawn and sent to the display every frame
+frame = Image.new(device.mode, device.size)
+draw = ImageDraw.Draw(frame)
+
+# Put the terminal in cbreak mode with non-blocking reads for keyboard input
+KEY_UP = b'\x1b[A'
+KEY_DOWN = b'\x1b[B'
+stdin_fd = sys.stdin.fileno()
+old_term = termios.tcgetattr(stdin_fd)
+old_flags = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
+tty.setcbreak(stdin_fd)
+fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
 
 # Define the Formula 1 car shape as rectangles (left, top, right, bottom) relative to its top-left corner
 car_parts = [
@@ -33,63 +45,91 @@ car_parts = [
 
 # Game variables
 car_slot = 1  # Start in the middle slot (0, 1, 2)
-obstacles = []  # List of (x, slots_occupied)
 game_over = False
 frame_count = 0
+FRAME_TIME = 0.05  # 20 FPS
 obstacle_width = 4  # Fixed width of obstacles
 
+# Obstacles live in fixed-size parallel arrays: x position and a bit mask of
+# the slots they occupy (bit i set = slot i), with `active` marking used entries
+MAX_OBSTACLES = 16
+obs_x = np.full(MAX_OBSTACLES, 9999, dtype=np.int16)
+obs_mask = np.zeros(MAX_OBSTACLES, dtype=np.uint8)
+active = np.zeros(MAX_OBSTACLES, dtype=bool)
+# Vertical pixel span (top, bottom) covered by each slot mask
+MASK_SPAN = {0b001: (0, 7), 0b010: (8, 15), 0b100: (16, 23),
+             0b011: (0, 15), 0b110: (8, 23)}
+
 try:
+    deadline = time.monotonic()
     while not game_over:
-        # Handle user input
-        key = stdscr.getch()
-        if key == curses.KEY_UP and car_slot > 0:
-            car_slot -= 1  # Move car up
-        elif key == curses.KEY_DOWN and car_slot < 2:
-            car_slot += 1  # Move car down
-
-        # Update obstacle positions
-        for i in range(len(obstacles)):
-            obstacles[i] = (obstacles[i][0] - 2, obstacles[i][1])
-        # Remove off-screen obstacles
-        obstacles = [obs for obs in obstacles if obs[0] + obstacle_width >= 0]
+        # Handle user input (arrow keys arrive as 3-byte escape sequences)
+        try:
+            keys = os.read(stdin_fd, 8)
+        except BlockingIOError:
+            keys = b''
+        pos = 0
+        while pos < len(keys):
+            if keys.startswith(KEY_UP, pos):
+                if car_slot > 0:
+                    car_slot -= 1  # Move car up
+                pos += len(KEY_UP)
+            elif keys.startswith(KEY_DOWN, pos):
+                if car_slot < 2:
+                    car_slot += 1  # Move car down
+                pos += len(KEY_DOWN)
+            else:
+                pos += 1
+
+        # Move active obstacles in place and drop the ones that left the screen
+        np.subtract(obs_x, 2, out=obs_x, where=active)
+        active &= obs_x >= -obstacle_width
 
         # Generate new obstacles every 30 frames (50% less frequent than 20)
         if frame_count % 30 == 0:
             if random.random() < 0.5:
                 # Single-slot obstacle
                 slot = random.randint(0, 2)
-                obstacles.append((127, [slot]))
+                slots = 1 << slot
             else:
                 # Double-slot obstacle
-                slots = random.choice([[0, 1], [1, 2]])
-                obstacles.append((127, slots))
+                slots = random.choice([0b011, 0b110])
+            free = np.flatnonzero(~active)
+            if free.size:
+                obs_x[free[0]] = 127
+                obs_mask[free[0]] = slots
+                active[free[0]] = True
 
         # Check for collisions
-        for obs_x, obs_slots in obstacles:
-            if car_slot in obs_slots and obs_x <= 23:
-                game_over = True
-                break
+        if np.any(active & (obs_x <= 23) & (obs_mask & (1 << car_slot) != 0)):
+            game_over = True
 
         # Render the scene
-        with canvas(device) as draw:
-            # Draw the car
-            car_y = car_slot * 8
-            for left, top, right, bottom in car_parts:
-                draw.rectangle((0 + left, car_y + top, 0 + right, car_y + bottom), fill="white")
-            # Draw obstacles
-            for obs_x, obs_slots in obstacles:
-                y_min = min(obs_slots) * 8
-                y_max = (max(obs_slots) + 1) * 8 - 1
-                draw.rectangle((obs_x, y_min, obs_x + obstacle_width - 1, y_max), fill="white")
+        draw.rectangle(device.bounding_box, fill="black")  # Clear the frame
+        # Draw the car
+        car_y = car_slot * 8
+        for left, top, right, bottom in car_parts:
+            draw.rectangle((0 + left, car_y + top, 0 + right, car_y + bottom), fill="white")
+        # Draw obstacles
+        for x, slots in zip(obs_x[active].tolist(), obs_mask[active].tolist()):
+            y_min, y_max = MASK_SPAN[slots]
+            draw.rectangle((x, y_min, x + obstacle_width - 1, y_max), fill="white")
+        device.display(frame)
 
         # Increment frame counter
         frame_count += 1
 
-        # Control frame rate (20 FPS)
-        time.sleep(0.05)
+        # Control frame rate: sleep until the next frame deadline, and
+        # resync instead of bursting if the frame overran it
+        deadline += FRAME_TIME
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            deadline = time.monotonic()
 
 finally:
     # Clean up
-    curses.endwin()  # Restore terminal
-    with canvas(device) as draw:
-        draw.rectangle(device.bounding_box, fill="black")  # Clear display
+    fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags)
+    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)  # Restore terminal
+    device.clear()  # Clear display
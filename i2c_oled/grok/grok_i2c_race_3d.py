@@ -6,65 +6,87 @@
 # A - turn left
 # D - turn right
 
+import fcntl
+import os
+import sys
+import termios
 import time
+import tty
 import random
-import curses
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw
 
 # Initialize the OLED display
 serial = i2c(port=8, address=0x3C)  # Matches /dev/i2c-8 and address 0x3C
 device = ssd1306(serial)
 
-# Initialize curses for non-blocking keyboard input
-stdscr = curses.initscr()
-curses.noecho()
-curses.cbreak()
-stdscr.keypad(True)
-stdscr.nodelay(True)
+# Persistent frame buffer, redrawn and sent to the display every frame
+frame = Image.new(device.mode, device.size)
+draw = ImageDraw.Draw(frame)
+
+# Put the terminal in cbreak mode with non-blocking reads for keyboard input
+stdin_fd = sys.stdin.fileno()
+old_term = termios.tcgetattr(stdin_fd)
+old_flags = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
+tty.setcbreak(stdin_fd)
+fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
 
 # Game variables
 player_lane = 1  # Start in middle lane (0, 1, or 2)
 obstacles = []   # List of {'y': int, 'lane': int}
 score = 0
 running = True
+FRAME_TIME = 0.033  # ~30 FPS
 
 # Player's car x-positions for each lane (centers at y=31)
 player_x_positions = [21, 63, 105]
 
+# Road dividers for 3D effect never change, so they are drawn once into a
+# background image that starts every frame (dividers at 0, 42, 84, 127 at bottom)
+road = Image.new(device.mode, device.size)
+road_draw = ImageDraw.Draw(road)
+for i in range(4):
+    road_draw.line((64, 0, i * 127 // 3, 31), fill="white")
+
+# Obstacle line for every row and lane, precomputed with perspective:
+# the x-center moves towards the lane as y grows and the width grows
+# from 1 to 5 pixels
+obstacle_lines = []
+for y in range(32):
+    w = 1 + int(4 * (y / 31))
+    row = []
+    for x_center_bottom in player_x_positions:
+        x_center = 64 + (x_center_bottom - 64) * (y / 31)
+        row.append((x_center - w//2, y, x_center + w//2, y))
+    obstacle_lines.append(row)
+
 # Function to draw the game scene
 def draw_scene(draw):
-    # Draw road dividers for 3D effect
-    for i in range(4):
-        x_bottom = i * 127 // 3  # Dividers at 0, 42, 84, 127 at bottom
-        draw.line((64, 0, x_bottom, 31), fill="white")
-    
     # Draw player's car
     player_x = player_x_positions[player_lane]
     draw.rectangle((player_x - 2, 28, player_x + 2, 31), fill="white")
     
     # Draw obstacles
     for obs in obstacles:
-        y = obs['y']
-        lane = obs['lane']
-        # Calculate x-center based on lane and perspective
-        x_center_bottom = player_x_positions[lane]
-        x_center = 64 + (x_center_bottom - 64) * (y / 31)
-        w = 1 + int(4 * (y / 31))  # Width grows from 1 to 5 pixels
-        draw.line((x_center - w//2, y, x_center + w//2, y), fill="white")
+        draw.line(obstacle_lines[obs['y']][obs['lane']], fill="white")
 
 # Main game loop
 try:
+    deadline = time.monotonic()
     while running:
         # Handle keyboard input
-        key = stdscr.getch()
-        if key == ord('a') and player_lane > 0:
-            player_lane -= 1  # Move left
-        elif key == ord('d') and player_lane < 2:
-            player_lane += 1  # Move right
-        elif key == ord('q'):
-            running = False   # Quit game
+        try:
+            keys = os.read(stdin_fd, 8)
+        except BlockingIOError:
+            keys = b''
+        for key in keys:
+            if key == ord('a') and player_lane > 0:
+                player_lane -= 1  # Move left
+            elif key == ord('d') and player_lane < 2:
+                player_lane += 1  # Move right
+            elif key == ord('q'):
+                running = False   # Quit game
         
         # Update obstacles
         for obs in obstacles[:]:  # Copy list to modify during iteration
@@ -82,21 +104,27 @@ try:
             obstacles.append({'y': 0, 'lane': new_lane})
         
         # Draw the current frame
-        with canvas(device) as draw:
-            draw_scene(draw)
+        frame.paste(road)  # Start from the empty road
+        draw_scene(draw)
+        device.display(frame)
         
-        # Maintain ~30 FPS
-        time.sleep(0.033)
+        # Control frame rate: sleep until the next frame deadline, and
+        # resync instead of bursting if the frame overran it
+        deadline += FRAME_TIME
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            deadline = time.monotonic()
 
 finally:
     # Clean up terminal
-    curses.nocbreak()
-    stdscr.keypad(False)
-    curses.echo()
-    curses.endwin()
+    fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags)
+    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)
     
     # Display game over screen with score
-    with canvas(device) as draw:
-        draw.text((10, 10), "Game Over", fill="white")
-        draw.text((10, 20), f"Score: {score}", fill="white")
+    draw.rectangle(device.bounding_box, fill="black")  # Clear the frame
+    draw.text((10, 10), "Game Over", fill="white")
+    draw.text((10, 20), f"Score: {score}", fill="white")
+    device.display(frame)
     time.sleep(2)  # Show score for 2 seconds before exiting
@@ -2,31 +2,45 @@
 # Author: Grok 3
 # Licence: Public Domain
 
-import curses
+import fcntl
+import os
+import sys
+import termios
+import tty
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw
 from collections import deque
 import time
 import random
 
 # Function to generate food at a random position not occupied by the snake
-def generate_food(snake, grid_width, grid_height):
-    while True:
-        x = random.randint(0, grid_width - 1)
-        y = random.randint(0, grid_height - 1)
-        if (x, y) not in snake:
-            return (x, y)
+# (None once the snake fills the whole grid)
+def generate_food(snake_set, grid_width, grid_height):
+    free_cells = [(x, y) for x in range(grid_width) for y in range(grid_height)
+                  if (x, y) not in snake_set]
+    return random.choice(free_cells) if free_cells else None
 
 # Initialize the OLED display
 serial = i2c(port=8, address=0x3C)  # Adjust port if necessary
 device = ssd1306(serial, width=128, height=32)
 
-# Initialize curses for terminal input
-stdscr = curses.initscr()
-curses.cbreak()          # Disable line buffering
-stdscr.keypad(True)      # Enable keypad mode for arrow keys
-stdscr.nodelay(True)     # Non-blocking input
+# Persistent frame buffer, redrawn and sent to the display every frame
+frame = Image.new(device.mode, device.size)
+draw = ImageDraw.Draw(frame)
+
+# Put the terminal in cbreak mode with non-blocking reads for keyboard input
+# (arrow keys arrive as 3-byte escape sequences)
+KEY_UP = b'\x1b[A'
+KEY_DOWN = b'\x1b[B'
+KEY_RIGHT = b'\x1b[C'
+KEY_LEFT = b'\x1b[D'
+ARROW_KEYS = (KEY_UP, KEY_DOWN, KEY_RIGHT, KEY_LEFT)
+stdin_fd = sys.stdin.fileno()
+old_term = termios.tcgetattr(stdin_fd)
+old_flags = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
+tty.setcbreak(stdin_fd)
+fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
 
 # Set the size of each snake segment in pixels (default 2)
 segment_size = 4
@@ -37,24 +51,34 @@ grid_height = 30 // segment_size
 
 # Initialize snake near the left-center of the grid
 snake = deque([(2, grid_height//2), (3, grid_height//2), (4, grid_height//2)])
+snake_set = set(snake)  # Same cells as the deque, for O(1) membership tests
 direction = (1, 0)  # Initial direction: right (dx, dy)
-food = generate_food(snake, grid_width, grid_height)
+food = generate_food(snake_set, grid_width, grid_height)
 game_over = False
 update_interval = 0.2  # Snake moves every 0.2 seconds
+FRAME_TIME = 0.01  # Input and redraw rate, keeps the CPU from spinning
 last_update = time.time()
 
 try:
+    deadline = time.monotonic()
     while not game_over:
         # Capture arrow key input
-        key = stdscr.getch()
-        if key == curses.KEY_UP and direction != (0, 1):       # Prevent reversing
-            direction = (0, -1)  # Up
-        elif key == curses.KEY_DOWN and direction != (0, -1):
-            direction = (0, 1)   # Down
-        elif key == curses.KEY_LEFT and direction != (1, 0):
-            direction = (-1, 0)  # Left
-        elif key == curses.KEY_RIGHT and direction != (-1, 0):
-            direction = (1, 0)   # Right
+        try:
+            keys = os.read(stdin_fd, 8)
+        except BlockingIOError:
+            keys = b''
+        pos = 0
+        while pos < len(keys):
+            key = keys[pos:pos + 3]
+            if key == KEY_UP and direction != (0, 1):       # Prevent reversing
+                direction = (0, -1)  # Up
+            elif key == KEY_DOWN and direction != (0, -1):
+                direction = (0, 1)   # Down
+            elif key == KEY_LEFT and direction != (1, 0):
+                direction = (-1, 0)  # Left
+            elif key == KEY_RIGHT and direction != (-1, 0):
+                direction = (1, 0)   # Right
+            pos += 3 if key in ARROW_KEYS else 1
 
         # Update game state at fixed intervals
         current_time = time.time()
@@ -66,39 +90,52 @@ try:
             # Check for collisions with walls or body (excluding tail if moving there)
             if (new_head[0] < 0 or new_head[0] >= grid_width or
                 new_head[1] < 0 or new_head[1] >= grid_height or
-                (new_head in snake and new_head != snake[0])):
+                (new_head in snake_set and new_head != snake[0])):
                 game_over = True
             else:
+                if new_head != food:
+                    # Move by removing tail first, the head may step into
+                    # the cell it leaves
+                    snake_set.discard(snake.popleft())
                 snake.append(new_head)  # Add new head
+                snake_set.add(new_head)
                 if new_head == food:
-                    food = generate_food(snake, grid_width, grid_height)  # Grow and new food
-                else:
-                    snake.popleft()  # Move by removing tail
+                    food = generate_food(snake_set, grid_width, grid_height)  # Grow and new food
+                    if food is None:
+                        game_over = True  # No free cell left: the snake won
+                        print("You win!")
 
             last_update = current_time
 
         # Render the game on the OLED with border
-        with canvas(device) as draw:
-            # Clear the entire display
-            draw.rectangle(device.bounding_box, fill="black")
-            # Draw snake segments
-            for segment in snake:
-                x, y = segment
-                pixel_x = 1 + x * segment_size
-                pixel_y = 1 + y * segment_size
-                draw.rectangle((pixel_x, pixel_y, pixel_x + segment_size - 1, pixel_y + segment_size - 1), fill="white")
-            # Draw food
+        # Clear the entire display
+        draw.rectangle(device.bounding_box, fill="black")
+        # Draw snake segments
+        for segment in snake:
+            x, y = segment
+            pixel_x = 1 + x * segment_size
+            pixel_y = 1 + y * segment_size
+            draw.rectangle((pixel_x, pixel_y, pixel_x + segment_size - 1, pixel_y + segment_size - 1), fill="white")
+        # Draw food
+        if food is not None:
             x, y = food
             pixel_x = 1 + x * segment_size
             pixel_y = 1 + y * segment_size
             draw.rectangle((pixel_x, pixel_y, pixel_x + segment_size - 1, pixel_y + segment_size - 1), fill="white")
+        device.display(frame)
 
-        # Small delay to prevent CPU overload
-        time.sleep(0.01)
+        # Control frame rate: sleep until the next frame deadline, and
+        # resync instead of bursting if the frame overran it
+        deadline += FRAME_TIME
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            deadline = time.monotonic()
 
 finally:
     # Clean up on exit
-    curses.endwin()  # Restore terminal settings
+    fcntl.fcntl(stdin_fd, fcntl.F_SETFL, old_flags)
+    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)  # Restore terminal settings
     # Clear the display
-    with canvas(device) as draw:
-        draw.rectangle(device.bounding_box, fill="black")
+    device.clear()
@@ -2,22 +2,31 @@
 # Author: Deepseek R1
 # License: Public Domain
 
+import os
+import select
 import sys
+import termios
 import time
+import tty
 import random
-import curses
+import numpy as np
 from luma.core.interface.serial import i2c
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
+from PIL import Image, ImageDraw
 
 # OLED Configuration
 serial = i2c(port=8, address=0x3C)
 device = ssd1306(serial, rotate=1, width=128, height=32)  # Rotated 90 degrees
 
+# Persistent frame buffer, redrawn and sent to the display every frame
+frame = Image.new(device.mode, device.size)
+draw = ImageDraw.Draw(frame)
+
 # Game Constants
 COLUMNS = 8
 ROWS = 24  # 24 rows * 4px = 96px (leaves 32px for score)
 BLOCK_SIZE = 4
+FRAME_TIME = 0.1  # Longest wait for input between redraws
 
 # Tetromino Shapes
 SHAPES = [
@@ -49,9 +58,15 @@ SHAPES = [
      [(1,0), (0,1), (1,1), (0,2)]]
 ]
 
+# Shape tables as (rotations, 4 cells, x/y) arrays for vectorised grid checks
+SHAPE_CELLS = [np.array(rotations, dtype=np.int8) for rotations in SHAPES]
+
+# One lit block; np.kron scales every grid cell up to a BLOCK_SIZE square
+BLOCK = np.full((BLOCK_SIZE, BLOCK_SIZE), 255, dtype=np.uint8)
+
 class Tetris:
     def __init__(self):
-        self.grid = [[0] * COLUMNS for _ in range(ROWS)]
+        self.grid = np.zeros((ROWS, COLUMNS), dtype=np.uint8)
         self.current_shape = None
         self.current_x = 0
         self.current_y = 0
@@ -61,7 +76,7 @@ class Tetris:
         self.new_shape()
 
     def new_shape(self):
-        self.current_shape = random.choice(SHAPES)
+        self.current_shape = random.choice(SHAPE_CELLS)
         self.current_rot = 0
         self.current_x = COLUMNS // 2 - 2
         self.current_y = 0
@@ -72,14 +87,13 @@ class Tetris:
     def check_collision(self, dx=0, dy=0, rot=None):
         rot = self.current_rot if rot is None else rot
         shape = self.current_shape[rot % len(self.current_shape)]
-        for (x, y) in shape:
-            new_x = self.current_x + x + dx
-            new_y = self.current_y + y + dy
-            if new_x < 0 or new_x >= COLUMNS or new_y >= ROWS:
-                return True
-            if new_y >= 0 and self.grid[new_y][new_x]:
-                return True
-        return False
+        xs = shape[:, 0] + (self.current_x + dx)
+        ys = shape[:, 1] + (self.current_y + dy)
+        if (xs < 0).any() or (xs >= COLUMNS).any() or (ys >= ROWS).any():
+            return True
+        # Cells above the top edge can't collide with the grid
+        visible = ys >= 0
+        return bool(self.grid[ys[visible], xs[visible]].any())
 
     def rotate(self):
         new_rot = (self.current_rot + 1) % len(self.current_shape)
@@ -99,89 +113,101 @@ class Tetris:
         self.new_shape()
         return False
 
-    def merge_shape(self):
+    def shape_cells(self):
+        # Grid coordinates of the current shape's cells that lie on the grid
         shape = self.current_shape[self.current_rot]
-        for (x, y) in shape:
-            if 0 <= self.current_y + y < ROWS and 0 <= self.current_x + x < COLUMNS:
-                self.grid[self.current_y + y][self.current_x + x] = 1
+        xs = shape[:, 0] + self.current_x
+        ys = shape[:, 1] + self.current_y
+        inside = (ys >= 0) & (ys < ROWS) & (xs >= 0) & (xs < COLUMNS)
+        return ys[inside], xs[inside]
+
+    def merge_shape(self):
+        self.grid[self.shape_cells()] = 1
 
     def clear_lines(self):
-        lines = 0
-        for y in range(ROWS-1, -1, -1):
-            if all(self.grid[y]):
-                del self.grid[y]
-                self.grid.insert(0, [0]*COLUMNS)
-                lines += 1
+        # Drop all full rows at once: the remaining rows keep their order
+        # and settle at the bottom, with empty rows filled in on top
+        full = self.grid.all(axis=1)
+        lines = int(full.sum())
+        if lines:
+            self.grid[lines:] = self.grid[~full]
+            self.grid[:lines] = 0
         self.score += lines * 100
 
     def draw(self, canvas):
-        # Draw grid
-        for y in range(ROWS):
-            for x in range(COLUMNS):
-                if self.grid[y][x]:
-                    canvas.rectangle(
-                        (x*BLOCK_SIZE, y*BLOCK_SIZE,
-                         x*BLOCK_SIZE + BLOCK_SIZE-1, y*BLOCK_SIZE + BLOCK_SIZE-1),
-                        fill="white")
-        
-        # Draw current shape
+        # Draw grid and current shape as one upscaled bitmap
+        cells = self.grid.copy()
         if not self.game_over:
-            shape = self.current_shape[self.current_rot]
-            for (x, y) in shape:
-                draw_x = self.current_x + x
-                draw_y = self.current_y + y
-                if 0 <= draw_y < ROWS and 0 <= draw_x < COLUMNS:
-                    canvas.rectangle(
-                        (draw_x*BLOCK_SIZE, draw_y*BLOCK_SIZE,
-                         draw_x*BLOCK_SIZE + BLOCK_SIZE-1, draw_y*BLOCK_SIZE + BLOCK_SIZE-1),
-                        fill="white")
+            cells[self.shape_cells()] = 1
+        pixels = np.kron(cells, BLOCK)
+        canvas.bitmap((0, 0), Image.fromarray(pixels), fill="white")
         
         # Draw score
         canvas.text((0, ROWS*BLOCK_SIZE + 2), f"Score: {self.score}", fill="white")
         if self.game_over:
             canvas.text((0, ROWS*BLOCK_SIZE + 12), "GAME OVER!", fill="white")
 
-def main(stdscr):
-    # Set up curses
-    stdscr.nodelay(True)
-    curses.curs_set(0)
-    stdscr.timeout(100)
-    
+# Arrow keys arrive as 3-byte escape sequences on a cbreak terminal
+KEY_UP = b'\x1b[A'
+KEY_DOWN = b'\x1b[B'
+KEY_RIGHT = b'\x1b[C'
+KEY_LEFT = b'\x1b[D'
+ARROW_KEYS = (KEY_UP, KEY_DOWN, KEY_RIGHT, KEY_LEFT)
+
+def main(stdin_fd):
     tetris = Tetris()
     last_drop = time.time()
     auto_drop = 0.5
 
+    deadline = time.monotonic() + FRAME_TIME
     while not tetris.game_over:
-        # Handle input
-        key = stdscr.getch()
-        if key == curses.KEY_LEFT:
-            tetris.move(-1)
-        elif key == curses.KEY_RIGHT:
-            tetris.move(1)
-        elif key == curses.KEY_DOWN:
-            tetris.drop()
-        elif key == curses.KEY_UP:
-            tetris.rotate()
-        elif key == ord(' '):
-            while tetris.drop():
-                pass
-        elif key == ord('q'):
-            break
+        # Handle input, waiting for a key until the next frame is due
+        keys = b''
+        if select.select([stdin_fd], [], [], max(0, deadline - time.monotonic()))[0]:
+            keys = os.read(stdin_fd, 8)
+        pos = 0
+        while pos < len(keys):
+            key = keys[pos:pos + 3]
+            if key == KEY_LEFT:
+                tetris.move(-1)
+            elif key == KEY_RIGHT:
+                tetris.move(1)
+            elif key == KEY_DOWN:
+                tetris.drop()
+            elif key == KEY_UP:
+                tetris.rotate()
+            elif keys[pos] == ord(' '):
+                while tetris.drop():
+                    pass
+            elif keys[pos] == ord('q'):
+                return
+            pos += 3 if key in ARROW_KEYS else 1
 
         # Auto-drop and drawing (keep previous implementation)
         if time.time() - last_drop > auto_drop:
             tetris.drop()
             last_drop = time.time()
 
-        with canvas(device) as draw:
-            tetris.draw(draw)
+        draw.rectangle(device.bounding_box, fill="black")  # Clear the frame
+        tetris.draw(draw)
+        device.display(frame)
 
-        time.sleep(0.01)
+        # A key press redraws early; otherwise move to the next frame
+        # deadline, resyncing if this frame overran it
+        now = time.monotonic()
+        if now >= deadline:
+            deadline = max(deadline + FRAME_TIME, now)
 
     # Game over handling (keep previous implementation)
 
 if __name__ == "__main__":
+    # Put the terminal in cbreak mode for single-key input
+    stdin_fd = sys.stdin.fileno()
+    old_term = termios.tcgetattr(stdin_fd)
+    tty.setcbreak(stdin_fd)
     try:
-        curses.wrapper(main)
+        main(stdin_fd)
     except KeyboardInterrupt:
         pass
+    finally:
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)  # Restore terminal
@@ -6,8 +6,9 @@ License: Public Domain
 """
 
 from datetime import datetime
-from time import sleep
+from time import sleep, time
 
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
@@ -23,6 +24,27 @@ class OLEDi2c:
         self.height = 32
         self.font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
         self.font_size = 29
+        self.font = ImageFont.truetype(self.font_path, self.font_size)
+        # Digits share one height and one advance width, so every
+        # HH:MM:SS string has the same layout as this sample
+        sample = "00:00:00"
+        bbox = self.font.getbbox(sample)
+        text_x = (self.width - (bbox[2] - bbox[0])) // 2 - bbox[0]
+        self.text_y = (self.height - (bbox[3] - bbox[1])) // 2 - bbox[1]
+        self.char_x = [text_x + round(self.font.getlength(sample[:i]))
+                       for i in range(len(sample))]
+        # Render each glyph once; frames are composed by pasting them
+        self.glyphs = {}
+        for char in "0123456789:":
+            left, _, right, _ = self.font.getbbox(char)
+            glyph = Image.new("1", (right - left, self.height))
+            ImageDraw.Draw(glyph).text((-left, self.text_y), char, font=self.font, fill=1)
+            self.glyphs[char] = (glyph, left)
+        # Frame buffer reused across refreshes
+        self.image = Image.new("1", (self.width, self.height))
+        self.draw = ImageDraw.Draw(self.image)
+        # Packed copy of what the display RAM currently holds
+        self.shadow = np.zeros((4, self.width), dtype=np.uint8)
         self.initialize_oled()
 
     def ssd1306_command(self, cmd: int) -> None:
@@ -38,65 +60,63 @@ class OLEDi2c:
             0x8D, 0x14, 0x20, 0x00, 0xA1, 0xC8, 0xDA, 0x02,
             0x81, contrast_bit, 0xD9, 0xF1, 0xDB, 0x40, 0xA4, 0xA6, 0xAF
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        # Control byte 0x00 marks the rest of the message as a command stream
+        self.i2c.transfer(self.address, [I2C.Message([0x00] + commands)])
         self.clear_display()
 
+    def write_window(self, columns: tuple, pages: tuple, data: bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer."""
+        # In horizontal addressing mode the pointer wraps to the next page
+        # at the window's last column, so one data message fills it all
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
+    def update_window(self, packed: np.ndarray) -> None:
+        """Send the smallest window covering every changed byte."""
+        changed = packed != self.shadow
+        pages = np.flatnonzero(changed.any(axis=1))
+        if not pages.size:
+            return
+        cols = np.flatnonzero(changed.any(axis=0))
+        p0, p1, c0, c1 = int(pages[0]), int(pages[-1]), int(cols[0]), int(cols[-1])
+        self.write_window((c0, c1), (p0, p1), packed[p0:p1 + 1, c0:c1 + 1].tobytes())
+        self.shadow[:] = packed
+
     def clear_display(self) -> None:
         """Clear the display."""
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            msg = I2C.Message([0x40] + [0x00] * 128)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
+        self.shadow[:] = 0
 
     def display(self) -> None:
         """Display the current time on the OLED."""
-        image = Image.new("1", (self.width, self.height))
-        draw = ImageDraw.Draw(image)
-        font = ImageFont.truetype(self.font_path, self.font_size)
+        image = self.image
+        draw = self.draw
+        draw.rectangle((0, 0, self.width, self.height), fill=0)
         text = datetime.now().strftime('%H:%M:%S')
 
-        # Calculate centered text position
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (self.width - text_width) // 2 - bbox[0]
-        y = (self.height - text_height) // 2 - bbox[1]
+        # Paste the cached glyphs at their fixed positions
+        for char, x in zip(text, self.char_x):
+            glyph, left = self.glyphs[char]
+            image.paste(glyph, (x + left, 0), glyph)
 
-        draw.text((x, y), text, font=font, fill=1)
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(image, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
 
         # Send image data to display
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            page_data = [0] * 128
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= pixel << bit
-                page_data[col] = byte
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        self.update_window(packed)
 
 # Initialize OLED and run the clock
 oled = OLEDi2c()
-oled.display()
-previous_second = datetime.now().second
 
 try:
     while True:
-        current_second = datetime.now().second
-        if current_second != previous_second:
-            oled.display()
-            previous_second = current_second
-        sleep(0.01)
+        oled.display()
+        # Wake up once, right after the next second boundary
+        now = time()
+        sleep(1.0 - (now - int(now)))
 except KeyboardInterrupt:
     oled.clear_display()
 finally:
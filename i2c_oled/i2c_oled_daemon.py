@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Display Daemon | OLED I2C [128x32] @ Radxa Rock 5C Lite
+Author: https://github.com/c0m4r
+License: Public Domain
+
+Keeps the display initialized and accepts packed 512-byte frames
+(4 pages x 128 columns, LSB = top row) on a Unix socket, so short-lived
+scripts can draw without reopening the bus and re-initializing the display.
+"""
+
+import os
+import socket
+
+import numpy as np
+from periphery import I2C
+
+SOCK_PATH = "/tmp/oled_socket"
+FRAME_SIZE = 128 * 4
+
+
+class OLEDi2c:
+    """A class to control SSD1306-based OLED displays over I2C.
+
+    Attributes:
+        bus (str): Path to the I2C device file
+        address (int): I2C device address
+        i2c (I2C): I2C connection object
+        width (int): Display width in pixels
+        height (int): Display height in pixels
+        shadow (np.ndarray): Packed copy of what the display RAM holds
+    """
+
+    def __init__(self, bus: str="/dev/i2c-8", address: int=0x3C) -> None:
+        """Initialize the OLED display controller.
+
+        Args:
+            bus (str): Path to I2C device file. Default is '/dev/i2c-8'.
+            address (int): I2C device address. Default is 0x3C.
+        """
+        self.bus = bus
+        self.address = address
+        self.i2c = I2C(self.bus)
+        self.width = 128
+        self.height = 32
+        self.shadow = np.zeros((4, self.width), dtype=np.uint8)
+        self.initialize_oled()
+
+    def initialize_oled(self) -> None:
+        """Initialize the display with required configuration commands."""
+        commands = [
+            0xAE, 0xD5, 0x80, 0xA8, 0x1F, 0xD3, 0x00, 0x40,
+            0x8D, 0x14, 0x20, 0x00, 0xA1, 0xC8, 0xDA, 0x02,
+            0x81, 0xCF, 0xD9, 0xF1, 0xDB, 0x40, 0xA4, 0xA6, 0xAF
+        ]
+        # Control byte 0x00 marks the rest of the message as a command stream
+        self.i2c.transfer(self.address, [I2C.Message([0x00] + commands)])
+        self.clear_display()
+
+    def write_window(self, columns: tuple, pages: tuple, data: bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer.
+
+        In horizontal addressing mode the pointer wraps to the next page at
+        the window's last column, so one data message fills the whole window.
+
+        Args:
+            columns (tuple): First and last column of the window
+            pages (tuple): First and last page (0-3) of the window
+            data (bytes): Window bytes, page by page
+        """
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
+    def update_window(self, packed: np.ndarray) -> None:
+        """Send the smallest window covering every changed byte.
+
+        Args:
+            packed (np.ndarray): 4x128 array of packed page bytes
+        """
+        changed = packed != self.shadow
+        pages = np.flatnonzero(changed.any(axis=1))
+        if not pages.size:
+            return
+        cols = np.flatnonzero(changed.any(axis=0))
+        p0, p1, c0, c1 = int(pages[0]), int(pages[-1]), int(cols[0]), int(cols[-1])
+        self.write_window((c0, c1), (p0, p1), packed[p0:p1 + 1, c0:c1 + 1].tobytes())
+        self.shadow[:] = packed
+
+    def clear_display(self) -> None:
+        """Clear the display."""
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
+        self.shadow[:] = 0
+
+    def close(self) -> None:
+        """Close the I2C connection."""
+        self.i2c.close()
+
+
+def serve(oled: OLEDi2c, sock_path: str=SOCK_PATH) -> None:
+    """Show every frame received on the socket, one client at a time.
+
+    Args:
+        oled (OLEDi2c): Initialized display to draw on
+        sock_path (str): Path of the Unix socket to listen on
+    """
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(sock_path)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rb") as frames:
+                # A client may send any number of frames before closing
+                while len(frame := frames.read(FRAME_SIZE)) == FRAME_SIZE:
+                    packed = np.frombuffer(frame, dtype=np.uint8).reshape(4, oled.width)
+                    oled.update_window(packed)
+
+
+if __name__ == "__main__":
+    oled = OLEDi2c()
+    try:
+        serve(oled)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        oled.clear_display()
+        oled.close()
+        if os.path.exists(SOCK_PATH):
+            os.unlink(SOCK_PATH)
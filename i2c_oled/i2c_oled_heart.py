@@ -5,12 +5,69 @@ Author: Deepseek R1 + https://github.com/c0m4r
 License: Public Domain
 """
 
-from time import sleep
+import signal
+from functools import lru_cache
 
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw
 
 
+@lru_cache(maxsize=None)
+def render_heart(width: int, height: int, heart_size: int) -> np.ndarray:
+    """Rasterize the heart once per size into packed page bytes.
+
+    Args:
+        width (int): Display width in pixels
+        height (int): Display height in pixels
+        heart_size (int): Diameter of the heart in pixels
+
+    Returns:
+        np.ndarray: Read-only (pages, width) array of column bytes
+    """
+    # Create all-white image
+    image = Image.new("1", (width, height), 1)
+    draw = ImageDraw.Draw(image)
+
+    # Calculate center position
+    x_center = width // 2
+    y_center = height // 2
+
+    # Draw left circle of the heart
+    draw.ellipse((
+        x_center - heart_size,
+        y_center - heart_size//2,
+        x_center,
+        y_center + heart_size//2
+    ), fill=0)
+
+    # Draw right circle of the heart
+    draw.ellipse((
+        x_center,
+        y_center - heart_size//2,
+        x_center + heart_size,
+        y_center + heart_size//2
+    ), fill=0)
+
+    # Draw bottom triangle to complete heart shape
+    draw.polygon([
+        (x_center - heart_size, y_center),
+        (x_center + heart_size, y_center),
+        (x_center, y_center + heart_size)
+    ], fill=0)
+
+    # Invert pixel values for black-on-white display, then pack 8 pixel
+    # rows per page into column bytes (LSB = top row)
+    pixels = 1 - np.asarray(image, dtype=np.uint8)
+    packed = np.packbits(pixels, axis=0, bitorder='little')
+    packed.flags.writeable = False
+    return packed
+
+
+# Bake the default heart at import time
+render_heart(128, 32, 16)
+
+
 class OLEDi2c:
     """A class to control SSD1306-based OLED displays over I2C.
 
@@ -20,6 +77,7 @@ class OLEDi2c:
         i2c (I2C): I2C connection object
         width (int): Display width in pixels
         height (int): Display height in pixels
+        shadow (np.ndarray): Packed copy of what the display RAM holds
     """
 
     def __init__(self, bus: str="/dev/i2c-8", address: int=0x3C) -> None:
@@ -34,6 +92,7 @@ class OLEDi2c:
         self.i2c = I2C(self.bus)
         self.width = 128
         self.height = 32
+        self.shadow = np.zeros((4, self.width), dtype=np.uint8)
         self.initialize_oled()
 
     def ssd1306_command(self, cmd: int) -> None:
@@ -65,21 +124,46 @@ class OLEDi2c:
             0xA6,       # Set normal display (not inverted)
             0xAF        # Display on
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        # Control byte 0x00 marks the rest of the message as a command stream
+        self.i2c.transfer(self.address, [I2C.Message([0x00] + commands)])
         self.clear_display()
 
+    def write_window(self, columns: tuple, pages: tuple, data: bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer.
+
+        In horizontal addressing mode the pointer wraps to the next page at
+        the window's last column, so one data message fills the whole window.
+
+        Args:
+            columns (tuple): First and last column of the window
+            pages (tuple): First and last page (0-3) of the window
+            data (bytes): Window bytes, page by page
+        """
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
+    def update_window(self, packed: np.ndarray) -> None:
+        """Send the smallest window covering every changed byte.
+
+        Args:
+            packed (np.ndarray): 4x128 array of packed page bytes
+        """
+        changed = packed != self.shadow
+        pages = np.flatnonzero(changed.any(axis=1))
+        if not pages.size:
+            return
+        cols = np.flatnonzero(changed.any(axis=0))
+        p0, p1, c0, c1 = int(pages[0]), int(pages[-1]), int(cols[0]), int(cols[-1])
+        self.write_window((c0, c1), (p0, p1), packed[p0:p1 + 1, c0:c1 + 1].tobytes())
+        self.shadow[:] = packed
+
     def clear_display(self) -> None:
         """Clear the display."""
         # Clear all 4 pages (32px height)
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            # Send 128 white pixels (0xFF) per page
-            data = [0x40] + [0x00] * self.width
-            msg = I2C.Message(data)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
+        self.shadow[:] = 0
 
     def draw_heart(self, heart_size: int=16) -> None:
         """Draw a black heart shape on a white background.
@@ -87,57 +171,7 @@ class OLEDi2c:
         Args:
             heart_size (int): Diameter of the heart in pixels. Default is 12.
         """
-        # Create all-white image
-        image = Image.new("1", (self.width, self.height), 1)
-        draw = ImageDraw.Draw(image)
-
-        # Calculate center position
-        x_center = self.width // 2
-        y_center = self.height // 2
-
-        # Draw left circle of the heart
-        draw.ellipse((
-            x_center - heart_size,
-            y_center - heart_size//2,
-            x_center,
-            y_center + heart_size//2
-        ), fill=0)
-
-        # Draw right circle of the heart
-        draw.ellipse((
-            x_center,
-            y_center - heart_size//2,
-            x_center + heart_size,
-            y_center + heart_size//2
-        ), fill=0)
-
-        # Draw bottom triangle to complete heart shape
-        draw.polygon([
-            (x_center - heart_size, y_center),
-            (x_center + heart_size, y_center),
-            (x_center, y_center + heart_size)
-        ], fill=0)
-
-        # Send image data to display
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                        # Invert pixel value for black-on-white display
-                        byte |= (not pixel) << bit
-                    except IndexError:
-                        pass
-                page_data.append(byte)
-
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        self.update_window(render_heart(self.width, self.height, heart_size))
 
     def close(self) -> None:
         """Close the I2C connection and clean up resources."""
@@ -149,9 +183,8 @@ if __name__ == "__main__":
     oled = OLEDi2c()
     try:
         oled.draw_heart()
-        # Keep display active until interrupted
-        while True:
-            sleep(1)
+        # The display keeps showing its RAM, so just wait for Ctrl+C
+        signal.pause()
     except KeyboardInterrupt:
         print("bye")
         oled.clear_display()
@@ -7,13 +7,12 @@ License: Public Domain
 """
 
 import sys
-import json
-import socket
-import subprocess
 import threading
-from time import sleep, time
+from time import monotonic, sleep
 from typing import Optional
 
+import mpv
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
@@ -31,12 +30,14 @@ class RadioDisplay:
         previous_title: Previously displayed track title
         scroll_pos: Current horizontal scroll position
         font: Font used for text rendering
+        image: Frame buffer reused for every redraw
+        draw: Drawing context bound to the frame buffer
         running: Flag to control execution threads
         title_changed: Flag indicating title update
-        last_update: Timestamp of last scroll update
+        title_event: Event set to wake the scroller on a title change
+        last_update: Monotonic time the current scroll pass started
         scroll_speed: Scrolling speed in pixels per second
-        sock_path: Path for MPV IPC socket
-        mpv_process: MPV player subprocess handle
+        player: In-process MPV player
     """
 
     def __init__(self, url: str, bus: str = "/dev/i2c-8", address: int = 0x3C) -> None:
@@ -56,23 +57,47 @@ class RadioDisplay:
         self.previous_title = ""
         self.scroll_pos = 0
         self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
+        self.image = Image.new("1", (self.width, self.height))
+        self.draw = ImageDraw.Draw(self.image)
+        # Title whose pixel width was measured last, with that width and
+        # the horizontal extent of its ink relative to the pen position
+        self.measured_title = None
+        self.measured_width = 0
+        self.measured_ink = (0, 0)
         self.running = True
         self.title_changed = False
+        self.title_event = threading.Event()
         self.last_update = 0
         self.scroll_speed = 20  # pixels per second
-        self.sock_path = "/tmp/mpv_socket"
-        self.mpv_process: Optional[subprocess.Popen] = None
+        self.player: Optional[mpv.MPV] = None
         self._initialize_display()
 
-    def _send_command(self, cmd: int) -> None:
-        """Send a command to the OLED controller.
+    def _send_commands(self, cmds: list) -> None:
+        """Send a sequence of commands to the OLED controller.
 
         Args:
-            cmd: Command byte to send to the display controller
+            cmds: Command bytes to send to the display controller
         """
-        msg = I2C.Message([0x00, cmd])
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def _write_window(self, columns: tuple, pages: tuple, data: bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer.
+
+        In horizontal addressing mode the pointer wraps to the next page at
+        the window's last column, so one data message fills the whole window.
+
+        Args:
+            columns: First and last column of the window
+            pages: First and last page (0-3) of the window
+            data: Window bytes, page by page
+        """
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
     def _initialize_display(self) -> None:
         """Initialize the OLED display with required configuration commands."""
         init_commands = [
@@ -80,19 +105,28 @@ class RadioDisplay:
             0x8D, 0x14, 0x20, 0x00, 0xA1, 0xC8, 0xDA, 0x02,
             0x81, 0xCF, 0xD9, 0xF1, 0xDB, 0x40, 0xA4, 0xA6, 0xAF
         ]
-        for cmd in init_commands:
-            self._send_command(cmd)
+        self._send_commands(init_commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear the entire display by writing blank pixels."""
-        for page in range(4):
-            self._send_command(0xB0 + page)
-            self._send_command(0x00)
-            self._send_command(0x10)
-            blank_data = [0x40] + [0x00] * self.width
-            msg = I2C.Message(blank_data)
-            self.i2c.transfer(self.address, [msg])
+        self._write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
+
+    def _title_width(self, text: str) -> float:
+        """Return the rendered width of a title, measuring each title once.
+
+        Args:
+            text: Title to measure
+
+        Returns:
+            Width of the title in pixels
+        """
+        if text != self.measured_title:
+            self.measured_width = self.draw.textlength(text, font=self.font)
+            left, _, right, _ = self.font.getbbox(text, mode="1")
+            self.measured_ink = (left, right)
+            self.measured_title = text
+        return self.measured_width
 
     def _draw_text(self) -> None:
         """Render the current title on the display with scrolling or centering.
@@ -100,11 +134,12 @@ class RadioDisplay:
         Uses Pillow's ImageDraw to create a frame buffer and sends it to the OLED.
         Handles both static centered text and smooth scrolling for long titles.
         """
-        img = Image.new("1", (self.width, self.height))
-        draw = ImageDraw.Draw(img)
+        img = self.image
+        draw = self.draw
+        draw.rectangle((0, 0, self.width, self.height), fill=0)
 
         text = self.current_title
-        text_width = draw.textlength(text, font=self.font)
+        text_width = self._title_width(text)
         x_pos = int(self.scroll_pos)
 
         if text_width <= self.width:
@@ -112,68 +147,50 @@ class RadioDisplay:
             x = (self.width - text_width) // 2
             draw.text((x, 10), text, font=self.font, fill=1)
         else:
-            # Draw scrolling text with wrap-around
-            draw.text((x_pos, 10), text, font=self.font, fill=1)
-            draw.text((x_pos - text_width - 20, 10), text, font=self.font, fill=1)
+            # Draw scrolling text with wrap-around, skipping a copy whose
+            # ink (plus a pixel for subpixel pen positions) is off-screen
+            left, right = self.measured_ink
+            for x in (x_pos, x_pos - text_width - 20):
+                if x + right + 1 > 0 and x + left - 1 < self.width:
+                    draw.text((x, 10), text, font=self.font, fill=1)
+
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(img, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
 
         # Update display
-        for page in range(4):
-            self._send_command(0xB0 + page)
-            self._send_command(0x00)
-            self._send_command(0x10)
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = img.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= pixel << bit
-                page_data.append(byte)
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
-
-    def _mpv_ipc_handler(self) -> None:
-        """Manage MPV IPC connection and metadata updates.
-
-        Starts the MPV player with IPC socket and continuously polls for metadata updates.
-        Handles connection errors and retries automatically.
+        self._write_window((0, self.width - 1), (0, 3), packed.tobytes())
+
+    def _start_player(self) -> None:
+        """Start playing the radio stream with libmpv.
+
+        MPV calls back from its own event thread with the current metadata
+        and again on every change, so nothing has to be polled.
         """
-        mpv_cmd = [
-            "mpv",
-            "--no-video",
-            "--idle=yes",
-            f"--input-ipc-server={self.sock_path}",
-            self.url
-        ]
-        self.mpv_process = subprocess.Popen(mpv_cmd)
+        self.player = mpv.MPV(video=False, idle=True)
+        self.player.observe_property("metadata", self._on_metadata)
+        self.player.play(self.url)
 
-        while self.running:
-            try:
-                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                    s.connect(self.sock_path)
-                    while self.running:
-                        s.send(b'{ "command": ["get_property", "metadata"] }\n')
-                        data = s.recv(4096)
-                        try:
-                            metadata = json.loads(data.decode())["data"]
-                            new_title = ""
-                            if "icy-title" in metadata:
-                                new_title = metadata["icy-title"]
-                            elif "Title" in metadata:
-                                new_title = metadata["Title"]
-
-                            if new_title and new_title != self.current_title:
-                                self.previous_title = self.current_title
-                                self.current_title = new_title
-                                self.title_changed = True
-
-                        except (KeyError, json.JSONDecodeError):
-                            pass
-                        sleep(1)
-            except (ConnectionRefusedError, FileNotFoundError):
-                sleep(1)
+    def _on_metadata(self, _name: str, metadata: Optional[dict]) -> None:
+        """Update the current title from new stream metadata.
+
+        Args:
+            _name: Name of the observed property
+            metadata: Stream metadata, or None until it is known
+        """
+        if not metadata:
+            return
+        new_title = ""
+        if "icy-title" in metadata:
+            new_title = metadata["icy-title"]
+        elif "Title" in metadata:
+            new_title = metadata["Title"]
+
+        if new_title and new_title != self.current_title:
+            self.previous_title = self.current_title
+            self.current_title = new_title
+            self.title_changed = True
+            self.title_event.set()
 
     def _title_scroller(self) -> None:
         """Manage text scrolling animation and display updates.
@@ -185,46 +202,55 @@ class RadioDisplay:
         last_title = ""
         scroll_cycle = 0
         pause_duration = 2  # Seconds to pause at start/end
+        frame_time = 0.05  # Seconds between scroll frames
+        next_frame = monotonic()
 
         while self.running:
-            img = Image.new("1", (self.width, self.height))
-            draw = ImageDraw.Draw(img)
-            text_width = draw.textlength(self.current_title, font=self.font)
+            text_width = self._title_width(self.current_title)
 
             if self.title_changed:
                 self.scroll_pos = 0
                 self.title_changed = False
                 last_title = self.current_title
                 scroll_cycle = text_width + self.width + 20
-                self.last_update = int(time())
+                self.last_update = monotonic()
 
             if text_width > self.width:
-                elapsed = time() - self.last_update
+                elapsed = monotonic() - self.last_update
                 self.scroll_pos = int((elapsed * self.scroll_speed) % scroll_cycle)
 
                 if self.scroll_pos > scroll_cycle - self.width:
                     self.scroll_pos = 0
-                    self.last_update = int(time())
                     sleep(pause_duration)
+                    self.last_update = monotonic()
             else:
                 self.scroll_pos = 0
                 if self.current_title != last_title:
-                    self.last_update = int(time())
                     last_title = self.current_title
                     sleep(pause_duration)
+                    self.last_update = monotonic()
 
             self._draw_text()
-            sleep(0.05)
+            # A static title only needs redrawing when it changes; a
+            # scrolling one ticks on a fixed frame deadline (resynced if a
+            # frame or pause overran it) but still reacts at once
+            if text_width > self.width:
+                next_frame = max(next_frame + frame_time, monotonic())
+                woken = self.title_event.wait(next_frame - monotonic())
+            else:
+                woken = self.title_event.wait()
+            self.title_event.clear()
+            if woken:
+                next_frame = monotonic()
 
     def run(self) -> None:
         """Main execution method to start radio playback and display.
 
-        Starts IPC handler thread and title scroller in main thread.
+        Starts the player and runs the title scroller in the main thread.
         Handles keyboard interrupts for clean shutdown.
         """
         try:
-            ipc_thread = threading.Thread(target=self._mpv_ipc_handler)
-            ipc_thread.start()
+            self._start_player()
             self._title_scroller()
         except KeyboardInterrupt:
             self.stop()
@@ -232,11 +258,12 @@ class RadioDisplay:
     def stop(self) -> None:
         """Cleanup method to stop playback and reset display.
 
-        Terminates MPV process, clears display, and closes I2C connection.
+        Terminates the MPV player, clears display, and closes I2C connection.
         """
         self.running = False
-        if self.mpv_process:
-            self.mpv_process.terminate()
+        self.title_event.set()
+        if self.player:
+            self.player.terminate()
         self.clear_display()
         self.i2c.close()
 
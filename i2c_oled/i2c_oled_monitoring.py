@@ -6,29 +6,84 @@ Author: Deepseek R1 + https://github.com/c0m4r
 License: Public Domain
 """
 
-import textwrap
+import socket
 import sys
+from functools import lru_cache
+from typing import Optional
 
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
+SOCK_PATH = "/tmp/oled_socket"  # see i2c_oled_daemon.py
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@lru_cache(maxsize=4)
+def load_font(path:str, size:int) -> ImageFont.FreeTypeFont:
+    """Load font"""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=32)
+def wrap_text(text:str, font:ImageFont.FreeTypeFont, width:int) -> tuple:
+    """Wrap text"""
+    # Greedy word wrap by rendered width, so wide fonts don't run off the
+    # display the way a fixed character count does
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and font.getlength(candidate) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return tuple(lines)
+
+
 class OledI2C:
     """OLED I2C Class"""
     def __init__(self, bus:str="/dev/i2c-8", address:int=0x3C) -> None:
         """Init"""
         self.bus = bus
         self.address = address
-        self.i2c = I2C(self.bus)
         self.width = 128
         self.height = 32  # Adjusted for 128x32 display
 
-        self.initialize_oled()
-
-    def ssd1306_command(self, cmd:int) -> None:
-        """SSD1306 Command"""
-        msg = I2C.Message([0x00, cmd])
+        # Hand frames to the display daemon when it runs, so the display
+        # isn't reopened and re-initialized on every call
+        self.sock = self.connect_daemon()
+        if self.sock is None:
+            self.i2c = I2C(self.bus)
+            self.initialize_oled()
+
+    def connect_daemon(self) -> Optional[socket.socket]:
+        """Connect to the display daemon"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(SOCK_PATH)
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
+    def ssd1306_commands(self, cmds:list) -> None:
+        """SSD1306 Commands"""
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def write_window(self, columns:tuple, pages:tuple, data:bytes) -> None:
+        """Write window"""
+        # In horizontal addressing mode the pointer wraps to the next page at
+        # the window's last column, so one data message fills the whole window
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
     def initialize_oled(self) -> None:
         """Initialize OLED"""
         commands = [
@@ -49,32 +104,24 @@ class OledI2C:
             0xA6,       # Normal display
             0xAF        # Display on
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        self.ssd1306_commands(commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear display"""
         # Clear all 4 pages (32px height)
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            # Send 128 zeros per page in one transfer
-            data = [0x40] + [0x00] * self.width  # Co=0, D/C=1 with continuous data
-            msg = I2C.Message(data)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
 
     def display_text(self, text:str, text2:str, font_size:int) -> None:
         """Display text"""
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-        font2 = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", int(font_size))
+        font = load_font(FONT_PATH, 10)
+        font2 = load_font(FONT_PATH, int(font_size))
 
         image = Image.new("1", (self.width, self.height))
         draw = ImageDraw.Draw(image)
 
         # Adjust text wrapping and positioning for 32px height
-        lines = textwrap.wrap(text, width=21)  # ~21 chars per line for 8px font
+        lines = wrap_text(text, font, self.width)
         y_text = 0
         for line in lines:
             if y_text + 8 > self.height:
@@ -82,7 +129,7 @@ class OledI2C:
             draw.text((0, y_text), line, font=font, fill=255)
             y_text += 8
 
-        lines2 = textwrap.wrap(text2, width=21)
+        lines2 = wrap_text(text2, font2, self.width)
         y_text2 = y_text + 4  # Small spacing between sections
         for line in lines2:
             if y_text2 + 16 > self.height:
@@ -90,30 +137,26 @@ class OledI2C:
             draw.text((0, y_text2), line, font=font2, fill=255)
             y_text2 += 8
 
-        # Send entire pages in single transfers
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= (pixel & 0x1) << bit
-                page_data.append(byte)
-
-            # Send Co=1 (continuous), D/C=1 followed by all data bytes
-            msg = I2C.Message([0x40] + page_data)  # Co=0 for single byte, but optimized transfer
-            self.i2c.transfer(self.address, [msg])
+        # Rotating clockwise turns each display column into a 32px row that
+        # tobytes() packs MSB-first from the bottom pixel up, so every row
+        # holds the column's bytes for pages 3, 2, 1, 0 (LSB = top row)
+        columns = image.transpose(Image.Transpose.ROTATE_270).tobytes()
+        frame = b"".join(columns[3 - page::4] for page in range(4))
+
+        if self.sock:
+            # The daemon takes the whole frame, page by page
+            self.sock.sendall(frame)
+            return
+
+        # Send the whole frame in a single transfer
+        self.write_window((0, self.width - 1), (0, 3), frame)
 
     def close(self) -> None:
         """Close"""
-        self.i2c.close()
+        if self.sock:
+            self.sock.close()
+        else:
+            self.i2c.close()
 
 # Execute
 oled = OledI2C()
@@ -7,9 +7,24 @@ License: Public Domain
 """
 
 import time
+from functools import lru_cache
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
+@lru_cache(maxsize=16)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, parsing each path and size only once.
+
+    Args:
+        path (str): Path to the font file
+        size (int): Font size in points
+
+    Returns:
+        ImageFont.FreeTypeFont: The loaded font
+    """
+    return ImageFont.truetype(path, size)
+
 class OLEDi2c:
     """A class to control SSD1306-based OLED displays over I2C.
 
@@ -19,6 +34,8 @@ class OLEDi2c:
         i2c (I2C): I2C connection object
         width (int): Display width in pixels
         height (int): Display height in pixels
+        image (Image): Frame buffer reused across draws
+        draw (ImageDraw): Drawing context bound to the frame buffer
     """
 
     def __init__(self, bus:str="/dev/i2c-8", address:int=0x3C) -> None:
@@ -34,17 +51,37 @@ class OLEDi2c:
         self.width = 128
         self.height = 32
         self.font_path = "/usr/share/fonts/truetype/pixelmix.ttf"
+        # Frame buffer reused across draws
+        self.image = Image.new("1", (self.width, self.height))
+        self.draw = ImageDraw.Draw(self.image)
         self.initialize_oled()
 
-    def ssd1306_command(self, cmd:int) -> None:
-        """Send a single command to the SSD1306 controller.
+    def ssd1306_commands(self, cmds:list) -> None:
+        """Send a sequence of commands to the SSD1306 controller.
 
         Args:
-            cmd (int): Command byte to send to the display controller
+            cmds (list): Command bytes to send to the display controller
         """
-        msg = I2C.Message([0x00, cmd])
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def write_window(self, columns:tuple, pages:tuple, data:bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer.
+
+        In horizontal addressing mode the pointer wraps to the next page at
+        the window's last column, so one data message fills the whole window.
+
+        Args:
+            columns (tuple): First and last column of the window
+            pages (tuple): First and last page (0-3) of the window
+            data (bytes): Window bytes, page by page
+        """
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
     def initialize_oled(self) -> None:
         """Initialize the display with required configuration commands."""
         commands = [
@@ -52,18 +89,12 @@ class OLEDi2c:
             0x8D, 0x14, 0x20, 0x00, 0xA1, 0xC8, 0xDA, 0x02,
             0x81, 0xCF, 0xD9, 0xF1, 0xDB, 0x40, 0xA4, 0xA6, 0xAF
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        self.ssd1306_commands(commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear the display."""
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            msg = I2C.Message([0x40] + [0x00]*128)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
 
     def draw_text(self, text:str, font_size:int=18) -> None:
         """Draw text on the display.
@@ -72,9 +103,10 @@ class OLEDi2c:
             text (str): Text to display
             font_size (int): Font size. Default is 18.
         """
-        image = Image.new("1", (self.width, self.height))
-        draw = ImageDraw.Draw(image)
-        font = ImageFont.truetype(self.font_path, font_size)
+        image = self.image
+        draw = self.draw
+        draw.rectangle((0, 0, self.width, self.height), fill=0)
+        font = load_font(self.font_path, font_size)
 
         # Get text bounding box
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -87,29 +119,21 @@ class OLEDi2c:
 
         draw.text((x, y), text, font=font, fill=1)
 
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(image, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
+
         # Send to display
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= pixel << bit
-                page_data.append(byte)
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), packed.tobytes())
 
-    def draw_image(self, image_path: str) -> None:
-        """Draw a 128x32 PNG image on the display.
+    def pack_image(self, image_path: str) -> np.ndarray:
+        """Load a 128x32 PNG image and pack it into display page bytes.
 
         Args:
             image_path (str): Path to the PNG image file
+
+        Returns:
+            np.ndarray: (4, width) array of column bytes
         """
         # Open and convert image to 1-bit monochrome
         image = Image.open(image_path).convert('L').convert('1')
@@ -119,24 +143,25 @@ class OLEDi2c:
             print("wrong size")
             image = image.resize((self.width, self.height))
 
-        # Send to display
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        # Invert: White (255) becomes 1, Black (0) becomes 0
-                        pixel = 1 if image.getpixel((col, page * 8 + bit)) > 0 else 0
-                    except IndexError:
-                        pixel = 0
-                    byte |= pixel << bit
-                page_data.append(byte)
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(image, dtype=np.uint8)
+        return np.packbits(pixels, axis=0, bitorder='little')
+
+    def draw_packed(self, packed: np.ndarray) -> None:
+        """Send a full frame of packed page bytes to the display.
+
+        Args:
+            packed (np.ndarray): (4, width) array of column bytes
+        """
+        self.write_window((0, self.width - 1), (0, 3), packed.tobytes())
+
+    def draw_image(self, image_path: str) -> None:
+        """Draw a 128x32 PNG image on the display.
+
+        Args:
+            image_path (str): Path to the PNG image file
+        """
+        self.draw_packed(self.pack_image(image_path))
 
     def animate_frames(self, seq: list[tuple[str, float, str]]) -> None:
         """Animate frames with support for both text and images.
@@ -146,13 +171,16 @@ class OLEDi2c:
                 Each frame is a tuple of (content, display_time, content_type).
                 content_type can be 'text' or 'image'.
         """
+        # Decode and pack every image once instead of on each loop
+        images = {content: self.pack_image(content)
+                  for content, _, content_type in seq if content_type == 'image'}
         try:
             while True:
                 for content, delay, content_type in seq:
                     if content_type == 'text':
                         self.draw_text(content)  # delay repurposed as font size
                     elif content_type == 'image':
-                        self.draw_image(content)
+                        self.draw_packed(images[content])
                     time.sleep(delay)
         except KeyboardInterrupt:
             self.clear_display()
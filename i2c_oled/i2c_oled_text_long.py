@@ -6,12 +6,21 @@ Author: Deepseek R1 + https://github.com/c0m4r
 License: Public Domain
 """
 
+from functools import lru_cache
 from textwrap import wrap
 
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
 
+@lru_cache(maxsize=32)
+def wrap_text(text:str, width:int, max_lines:int) -> str:
+    """Wrap text"""
+    # Keep only the lines that fit on the display
+    return "\n".join(wrap(text, width=width)[:max_lines])
+
+
 class OledI2C:
     """OledI2C Class"""
     def __init__(self, bus:str="/dev/i2c-8", address:int=0x3C) -> None:
@@ -22,14 +31,30 @@ class OledI2C:
         self.width = 128
         self.height = 32  # Adjusted for 128x32 display
         self.font = ImageFont.truetype("/usr/share/fonts/truetype/pixelmix.ttf", 8)  # Adjusted font size
+        # multiline_text advances by the height of "A" plus spacing;
+        # pad that to one 8px line per display page
+        self.line_spacing = 8 - self.font.getbbox("A")[3]
+        # Frame buffer reused across draws
+        self.image = Image.new("1", (self.width, self.height))
+        self.draw = ImageDraw.Draw(self.image)
 
         self.initialize_oled()
 
-    def ssd1306_command(self, cmd:int) -> None:
-        """SSD1306 Command"""
-        msg = I2C.Message([0x00, cmd])
+    def ssd1306_commands(self, cmds:list) -> None:
+        """SSD1306 Commands"""
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def write_window(self, columns:tuple, pages:tuple, data:bytes) -> None:
+        """Write window"""
+        # In horizontal addressing mode the pointer wraps to the next page
+        # at the window's last column, so one data message fills it all
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
     def initialize_oled(self) -> None:
         """Initialize OLED"""
         commands = [
@@ -50,56 +75,30 @@ class OledI2C:
             0xA6,       # Normal display
             0xAF        # Display on
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        self.ssd1306_commands(commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear display"""
         # Clear all 4 pages (32px height)
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            # Send 128 zeros per page in one transfer
-            data = [0x40] + [0x00] * self.width  # Co=0, D/C=1 with continuous data
-            msg = I2C.Message(data)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
 
     def display_text(self, text:str) -> None:
         """Display text"""
-        image = Image.new("1", (self.width, self.height))
-        draw = ImageDraw.Draw(image)
+        image = self.image
+        draw = self.draw
+        draw.rectangle((0, 0, self.width, self.height), fill=0)
 
         # Adjust text wrapping and positioning for 32px height
-        lines = wrap(text, width=21)  # ~21 chars per line for 8px font
-        y_text = 0
-        for line in lines:
-            if y_text + 8 > self.height:
-                break
-            draw.text((0, y_text), line, font=self.font, fill=255)
-            y_text += 8
-
-        # Send entire pages in single transfers
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= (pixel & 0x1) << bit
-                page_data.append(byte)
-
-            # Send Co=1 (continuous), D/C=1 followed by all data bytes
-            msg = I2C.Message([0x40] + page_data)  # Co=0 for single byte, but optimized transfer
-            self.i2c.transfer(self.address, [msg])
+        lines = wrap_text(text, 21, self.height // 8)  # ~21 chars per line for 8px font
+        draw.multiline_text((0, 0), lines, font=self.font, fill=255, spacing=self.line_spacing)
+
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(image, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
+
+        # Send the whole frame in a single transfer
+        self.write_window((0, self.width - 1), (0, 3), packed.tobytes())
 
     def close(self) -> None:
         """Close"""
@@ -7,6 +7,7 @@ License: Public Domain
 
 import time
 
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
@@ -37,15 +38,32 @@ class OledI2C:
         self.font_path = "/usr/share/fonts/truetype/pixelmix.ttf"
         self.initialize_oled()
 
-    def ssd1306_command(self, cmd:int) -> None:
-        """Send a single command byte to SSD1306 controller.
+    def ssd1306_commands(self, cmds:list) -> None:
+        """Send command bytes to SSD1306 controller in one transfer.
 
         Args:
-            cmd (int): Command byte to send
+            cmds (list): Command bytes to send
         """
-        msg = I2C.Message([0x00, cmd])
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def write_window(self, columns:tuple, pages:tuple, data:bytes) -> None:
+        """Set a column/page window and stream its bytes in one transfer.
+
+        In horizontal addressing mode the pointer wraps to the next page at
+        the window's last column, so one data message fills the whole window.
+
+        Args:
+            columns (tuple): First and last column of the window
+            pages (tuple): First and last page (0-3) of the window
+            data (bytes): Window bytes, page by page
+        """
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
     def initialize_oled(self) -> None:
         """Initialize display with standard SSD1306 configuration sequence."""
         commands = [
@@ -53,18 +71,12 @@ class OledI2C:
             0x8D, 0x14, 0x20, 0x00, 0xA1, 0xC8, 0xDA, 0x02,
             0x81, 0xCF, 0xD9, 0xF1, 0xDB, 0x40, 0xA4, 0xA6, 0xAF
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        self.ssd1306_commands(commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear display by writing zeros to all pixels."""
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            msg = I2C.Message([0x40] + [0x00]*128)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
 
     def draw_image(self, image) -> None:
         """Draw a 1-bit PIL Image to the display.
@@ -73,22 +85,11 @@ class OledI2C:
             image (PIL.Image): Image to display, must be 1-bit mode and match
                 display dimensions (128x32 pixels)
         """
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = image.getpixel((col, page * 8 + bit))
-                    except IndexError:
-                        pixel = 0
-                    byte |= pixel << bit
-                page_data.append(byte)
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        # Pack 8 pixel rows per page into column bytes (LSB = top row)
+        pixels = np.asarray(image, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
+
+        self.write_window((0, self.width - 1), (0, 3), packed.tobytes())
 
     def side_scroll(self, text:str, font_size:int=18, speed:int=30) -> None:
         """Display smooth horizontal scrolling text with speed control.
@@ -102,36 +103,43 @@ class OledI2C:
         """
         font = ImageFont.truetype(self.font_path, font_size)
 
-        # Calculate text dimensions
-        temp_img = Image.new("1", (self.width, self.height))
-        draw = ImageDraw.Draw(temp_img)
-        bbox = draw.textbbox((0, 0), text + " ", font=font)
+        # Calculate text dimensions, with the same mono hinting draw.text
+        # uses on a 1-bit image
+        text = text + " "
+        bbox = font.getbbox(text, mode="1")
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
-        # Create scrolling buffer
-        buffer = Image.new("1", (text_width + self.width, text_height))
-        bdraw = ImageDraw.Draw(buffer)
-        bdraw.text((-bbox[0], -bbox[1]), text + " ", font=font, fill=1)
-
         x_pos = 0
         y_pos = (self.height - text_height) // 2
         scroll_width = text_width + self.width
 
+        # Draw the text once on a display-height strip with one blank screen
+        # of padding, so every window src_x..src_x+width lies inside it,
+        # and pack the whole strip into page bytes once
+        strip = Image.new("1", (scroll_width + self.width, self.height))
+        ImageDraw.Draw(strip).text((-bbox[0], y_pos - bbox[1]), text, font=font, fill=1)
+        pixels = np.asarray(strip, dtype=np.uint8)
+        packed = np.packbits(pixels, axis=0, bitorder='little')
+
+        # Build the full-screen window and data messages once; each frame
+        # copies its bytes into the data buffer, which periphery reads at
+        # transfer time
+        window_msg = I2C.Message([0x00, 0x21, 0, self.width - 1, 0x22, 0, 3])
+        buffer = bytearray(1 + self.width * 4)
+        buffer[0] = 0x40
+        data_msg = I2C.Message(buffer)
+        frame = np.frombuffer(buffer, dtype=np.uint8, offset=1).reshape(4, self.width)
+
         try:
             while True:
                 start_time = time.time()
 
-                img = Image.new("1", (self.width, self.height))
                 src_x = x_pos % scroll_width
 
-                # Copy visible portion from buffer
-                img.paste(buffer.crop((
-                    src_x, 0,
-                    src_x + self.width, text_height
-                )), (0, y_pos))
-
-                self.draw_image(img)
+                # Send the visible window of the packed strip
+                frame[:] = packed[:, src_x:src_x + self.width]
+                self.i2c.transfer(self.address, [window_msg, data_msg])
 
                 # Speed control
                 x_pos += 1
@@ -5,8 +5,9 @@ Author: Deepseek R1 + https://github.com/c0m4r
 License: Public Domain
 """
 
-import time
+import signal
 
+import numpy as np
 from periphery import I2C
 from PIL import Image, ImageDraw, ImageFont
 
@@ -19,13 +20,42 @@ class OLEDi2c:
         self.i2c = I2C(self.bus)
         self.width = 128
         self.height = 32
+        self.font_size = 24
+        self.font = ImageFont.truetype("/usr/share/fonts/truetype/pixelmix.ttf", self.font_size)
+        # Pixel rows of each character drawn so far
+        self.glyphs = {}
+        # Packed copy of what the display RAM currently holds
+        self.shadow = np.zeros((4, self.width), dtype=np.uint8)
+        # Portrait frame buffer (rows x columns) reused across redraws
+        self.frame = np.zeros((self.width, self.height), dtype=np.uint8)
         self.initialize_oled()
 
-    def ssd1306_command(self, cmd: int) -> None:
-        """Send a command to the SSD1306 controller."""
-        msg = I2C.Message([0x00, cmd])
+    def ssd1306_commands(self, cmds: list) -> None:
+        """Send a sequence of commands to the SSD1306 controller."""
+        # Control byte 0x00 marks the rest of the message as a command stream
+        msg = I2C.Message([0x00] + cmds)
         self.i2c.transfer(self.address, [msg])
 
+    def write_window(self, columns: tuple, pages: tuple, data: bytes) -> None:
+        """Set a column/page window and stream its bytes in a single transfer."""
+        # In horizontal addressing mode the pointer wraps to the next page
+        # at the window's last column, so one data message fills it all
+        self.i2c.transfer(self.address, [
+            I2C.Message([0x00, 0x21, columns[0], columns[1], 0x22, pages[0], pages[1]]),
+            I2C.Message(b"\x40" + data)
+        ])
+
+    def update_window(self, packed: np.ndarray) -> None:
+        """Send the smallest window covering every changed byte."""
+        changed = packed != self.shadow
+        pages = np.flatnonzero(changed.any(axis=1))
+        if not pages.size:
+            return
+        cols = np.flatnonzero(changed.any(axis=0))
+        p0, p1, c0, c1 = int(pages[0]), int(pages[-1]), int(cols[0]), int(cols[-1])
+        self.write_window((c0, c1), (p0, p1), packed[p0:p1 + 1, c0:c1 + 1].tobytes())
+        self.shadow[:] = packed
+
     def initialize_oled(self) -> None:
         """Initialize display with rotation support."""
         commands = [
@@ -46,68 +76,58 @@ class OLEDi2c:
             0xA6,       # Normal display
             0xAF        # Display on
         ]
-        for cmd in commands:
-            self.ssd1306_command(cmd)
+        self.ssd1306_commands(commands)
         self.clear_display()
 
     def clear_display(self) -> None:
         """Clear the display."""
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-            data = [0x40] + [0x00] * self.width
-            msg = I2C.Message(data)
-            self.i2c.transfer(self.address, [msg])
+        self.write_window((0, self.width - 1), (0, 3), bytes(self.width * 4))
+        self.shadow[:] = 0
+
+    def glyph(self, char: str) -> np.ndarray:
+        """Return the pixel rows of a character, centered across the portrait width."""
+        rows = self.glyphs.get(char)
+        if rows is None:
+            # Rasterize once, from the drawing origin down to the ink bottom
+            left, _, right, bottom = self.font.getbbox(char)
+            x = (self.height - (right - left)) // 2
+            image = Image.new("1", (self.height, max(bottom, 1)))
+            ImageDraw.Draw(image).text((x, 0), char, font=self.font, fill=1)
+            rows = self.glyphs[char] = np.asarray(image, dtype=np.uint8)
+        return rows
 
     def draw_vertical_text(self, text: str="HELLO") -> None:
         """Draw vertical text on rotated display."""
-        # Create vertical image (32x128) and rotate to match physical display
-        font_size = 24
-        font = ImageFont.truetype("/usr/share/fonts/truetype/pixelmix.ttf", font_size)
-
         # Get character height from the font
-        char_height = font_size + 2
+        char_height = self.font_size + 2
 
-        # Create portrait orientation image
-        img = Image.new("1", (32, 128), 1)
-        draw = ImageDraw.Draw(img)
+        # Clear the portrait orientation frame
+        frame = self.frame
+        frame[:] = 0
 
         # Calculate vertical position
         total_height = len(text) * char_height
         y_start = (128 - total_height) // 2
 
-        # Draw each character vertically centered
+        # Merge each cached glyph in, clipped to the frame
         y = y_start
         for char in text:
-            bbox = font.getbbox(char)
-            char_width = bbox[2] - bbox[0]  # right - left
-            x = (32 - char_width) // 2
-            draw.text((x, y), char, font=font, fill=0)
+            rows = self.glyph(char)
+            top, bottom = max(y, 0), min(y + len(rows), self.width)
+            if top < bottom:
+                frame[top:bottom] |= rows[top - y:bottom - y]
             y += char_height  # Move down by character height
 
-        # Rotate image 90 degrees clockwise for physical display
-        img = img.rotate(90, expand=True)
-
-        # Convert image to display format
-        for page in range(4):
-            self.ssd1306_command(0xB0 + page)
-            self.ssd1306_command(0x00)
-            self.ssd1306_command(0x10)
-
-            page_data = []
-            for col in range(self.width):
-                byte = 0
-                for bit in range(8):
-                    try:
-                        pixel = img.getpixel((col, page * 8 + bit))
-                        byte |= (not pixel) << bit
-                    except IndexError:
-                        pass
-                page_data.append(byte)
-
-            msg = I2C.Message([0x40] + page_data)
-            self.i2c.transfer(self.address, [msg])
+        # Rotate the pixels 90 degrees counter-clockwise for the physical
+        # display (same turn as Image.rotate(90, expand=True), as a view)
+        pixels = np.rot90(frame)
+
+        # Convert image to display format: pack 8 pixel rows per page into
+        # column bytes (LSB = top row), straight from the rotated view
+        packed = np.packbits(pixels, axis=0, bitorder='little')
+
+        # Send only what differs from the display, in one transfer
+        self.update_window(packed)
 
     def close(self) -> None:
         """Close I2C connection."""
@@ -117,9 +137,8 @@ if __name__ == "__main__":
     oled = OLEDi2c()
     try:
         oled.draw_vertical_text()
-        # Keep display active
-        while True:
-            time.sleep(1)
+        # The display keeps showing its RAM, so just wait for Ctrl+C
+        signal.pause()
     except KeyboardInterrupt:
         oled.clear_display()
         oled.close()
@@ -17,9 +17,11 @@ import time
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import argparse
+import concurrent.futures
 import os
+import struct
 import sys
-from typing import Union, List, Tuple, Optional, Sequence
+from typing import Union, List, Tuple, Optional, Sequence, Dict
 
 # --- Configuration ---
 # Display dimensions (configured for landscape where 320 is width)
@@ -28,6 +30,23 @@ from typing import Union, List, Tuple, Optional, Sequence
 WIDTH: int = 320
 HEIGHT: int = 240
 
+# spidev splits every write into transfers of at most this many bytes
+# (kernel default 4096, i.e. 38 transfers per 320x240 RGB565 frame).
+# Raise it with 'modprobe spidev bufsiz=65536' or 'spidev.bufsiz=65536'
+# on the kernel command line to send a frame in 3 transfers.
+SPIDEV_BUFSIZ_PATH: str = "/sys/module/spidev/parameters/bufsiz"
+
+# Consumer name prefix shown for the requested lines in 'gpioinfo'
+GPIO_CONSUMER: str = os.path.basename(__file__)
+
+# SPI clock: the ST7789 write cycle allows up to 62.5 MHz (16 ns SCL period).
+# A 320x240 RGB565 frame takes ~31 ms on the wire at 40 MHz and ~20 ms at
+# 62.5 MHz. If the controller rejects a rate, the next lower one is tried.
+# Long or unshielded wires may glitch (noise, shifted colors) below the
+# panel limit; find the board's floor with --spi-speed.
+SPI_SPEED_HZ: int = 62_500_000
+SPI_FALLBACK_SPEEDS_HZ: Tuple[int, ...] = (48_000_000, 40_000_000)
+
 # --- ST7789 Commands ---
 # Reference: Search for "ST7789 Datasheet"
 # Note: Not all commands are used in this basic driver.
@@ -138,7 +157,8 @@ class ST7789:
         Args:
             spi_port: SPI bus number (e.g., 0 for /dev/spidev0.0).
             spi_device: SPI device (chip select) number (e.g., 0 for /dev/spidev0.0).
-            spi_speed_hz: SPI clock speed in Hertz (e.g., 40_000_000 for 40MHz).
+            spi_speed_hz: SPI clock speed in Hertz (e.g., 62_500_000 for 62.5MHz).
+                          Falls back to SPI_FALLBACK_SPEEDS_HZ if rejected.
             gpio_chip_dc_path: Full path to the GPIO chip for the DC pin (e.g., '/dev/gpiochip4').
             dc_pin: Linux system GPIO number for the Data/Command (DC) pin.
             gpio_chip_rst_path: Full path to the GPIO chip for the RST pin (e.g., '/dev/gpiochip1').
@@ -160,16 +180,42 @@ class ST7789:
         self._spi: Optional[spidev.SpiDev] = None
         self._dc_request: Optional[gpiod.LineRequest] = None
         self._rst_request: Optional[gpiod.LineRequest] = None
+        self._dc_active: bool = False # DC level last driven (requested low = command mode)
+
+        # --- Reusable frame buffers ---
+        # Big-endian RGB565 output of display_image
+        self._pixbuf = np.empty((self.height, self.width, 2), dtype=np.uint8)
+        # Canvas that draw_text repaints in place
+        self._text_canvas = Image.new('RGB', (self.width, self.height))
+        self._text_draw = ImageDraw.Draw(self._text_canvas)
+        # Full-screen solid fills sent by clear(), keyed by RGB565 value
+        self._fill_cache: Dict[int, bytes] = {}
+        # Background color and text box of the last draw_text, while the panel
+        # still shows it (any other full-screen draw resets this)
+        self._text_shown: Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]] = None
+        # Background writer for display_image_async, with two alternating
+        # frame buffers so packing the next frame never touches the one in flight
+        self._write_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._async_bufs = [np.empty((self.height, self.width, 2), dtype=np.uint8) for _ in range(2)]
+        self._async_index = 0
+        self._pending: Optional[concurrent.futures.Future] = None
 
         try:
             # --- Initialize SPI ---
             print(f"Initializing SPI: /dev/spidev{spi_port}.{spi_device} at {spi_speed_hz/1_000_000:.1f} MHz")
             self._spi = spidev.SpiDev()
             self._spi.open(spi_port, spi_device)
-            self._spi.max_speed_hz = self.spi_speed_hz
+            self._set_spi_speed()
             # Mode 0: CPOL=0 (Clock Idle Low), CPHA=0 (Data sampled on rising edge)
             self._spi.mode = 0b00
+            # Bit order stays MSB-first (spidev default), as the ST7789 expects.
+            # Pixels are packed as big-endian RGB565 bytes in wire order, so no
+            # byteswap is needed; lsbfirst would reverse bits, not swap bytes.
             print("  SPI initialized successfully.")
+            self.spi_bufsiz = self._read_spi_bufsiz()
+            frame_size = self.width * self.height * 2
+            transfers = -(-frame_size // self.spi_bufsiz)
+            print(f"  spidev bufsiz: {self.spi_bufsiz} bytes ({transfers} transfers per frame)")
 
             # --- Initialize GPIO using gpiod v2 ---
             print(f"Initializing GPIO (using gpiod v2 API):")
@@ -180,7 +226,7 @@ class ST7789:
             print(f"  Requesting DC line {self.dc_offset} from {gpio_chip_dc_path}")
             self._dc_request = gpiod.request_lines(
                 gpio_chip_dc_path,
-                consumer=f"{os.path.basename(__file__)}-DC",
+                consumer=f"{GPIO_CONSUMER}-DC",
                 config={
                     self.dc_offset: gpiod.LineSettings(
                         direction=gpiod.line.Direction.OUTPUT,
@@ -195,7 +241,7 @@ class ST7789:
             # If RST chip is different, this opens it. If same, it reuses the underlying chip access.
             self._rst_request = gpiod.request_lines(
                 gpio_chip_rst_path,
-                consumer=f"{os.path.basename(__file__)}-RST",
+                consumer=f"{GPIO_CONSUMER}-RST",
                 config={
                     self.rst_offset: gpiod.LineSettings(
                         direction=gpiod.line.Direction.OUTPUT,
@@ -238,6 +284,9 @@ class ST7789:
     def close(self) -> None:
         """Clean up resources: Turn off display, release GPIO lines, close SPI."""
         print("Closing display resources...")
+        # Let a queued frame finish before turning the display off
+        self.flush()
+        self._write_executor.shutdown()
         try:
             # Optional: Put display into a safe state before closing
             if self._spi and self._dc_request: # Check if partially initialized
@@ -275,6 +324,42 @@ class ST7789:
 
         print("Resource cleanup finished.")
 
+    def _set_spi_speed(self) -> None:
+        """Set the SPI clock, stepping down to slower rates the controller accepts."""
+        speeds = [self.spi_speed_hz] + [hz for hz in SPI_FALLBACK_SPEEDS_HZ if hz < self.spi_speed_hz]
+        for speed_hz in speeds:
+            try:
+                self._spi.max_speed_hz = speed_hz
+                break
+            except OSError as e:
+                print(f"  SPI controller rejected {speed_hz/1_000_000:.1f} MHz: {e}")
+                if speed_hz == speeds[-1]:
+                    raise
+        if speed_hz != self.spi_speed_hz:
+            print(f"  Falling back to {speed_hz/1_000_000:.1f} MHz.")
+        self.spi_speed_hz = self._spi.max_speed_hz
+
+    @staticmethod
+    def _read_spi_bufsiz() -> int:
+        """Return the spidev per-transfer size limit, or its 4096 default."""
+        try:
+            with open(SPIDEV_BUFSIZ_PATH) as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return 4096
+
+    def _cmd_mode_on(self) -> None:
+        """Drive DC low for command bytes, unless it already is."""
+        if self._dc_active:
+            self._dc_request.set_value(self.dc_offset, gpiod.line.Value.INACTIVE)
+            self._dc_active = False
+
+    def _data_mode_on(self) -> None:
+        """Drive DC high for data bytes, unless it already is."""
+        if not self._dc_active:
+            self._dc_request.set_value(self.dc_offset, gpiod.line.Value.ACTIVE)
+            self._dc_active = True
+
     def command(self, cmd: int) -> None:
         """Send a command byte to the display."""
         if not self._dc_request or not self._spi:
@@ -283,28 +368,37 @@ class ST7789:
             return
         try:
             # Set DC line low for command mode
-            self._dc_request.set_value(self.dc_offset, gpiod.line.Value.INACTIVE)
+            self._cmd_mode_on()
             # Send the command byte
             self._spi.writebytes([cmd])
         except Exception as e:
             print(f"Error sending command 0x{cmd:02X}: {e}")
             # Consider re-raising or handling more robustly depending on needs
 
-    def data(self, data_val: Union[int, Sequence[int], bytes, bytearray]) -> None:
-        """Send data byte(s) to the display."""
+    def data(self, data_val: Union[int, Sequence[int], bytes, bytearray, memoryview, np.ndarray]) -> None:
+        """
+        Send data byte(s) to the display.
+
+        Buffer objects (bytes, bytearray, memoryview, contiguous NumPy arrays)
+        are handed to spidev as-is, without an intermediate copy; arrays are
+        sent in their in-memory byte order.
+        """
         if not self._dc_request or not self._spi:
             # Avoid errors if initialization failed or already closed
             # print("Warning: Attempted to send data but resources not ready.")
             return
         try:
-            # Set DC line high for data mode
-            self._dc_request.set_value(self.dc_offset, gpiod.line.Value.ACTIVE)
+            # Set DC line high for data mode; a frame streamed after RAMWR
+            # keeps it there for every chunk spidev splits the buffer into
+            self._data_mode_on()
 
             # Send the data
             if isinstance(data_val, int):
                 self._spi.writebytes([data_val])
-            elif isinstance(data_val, (bytes, bytearray)):
-                self._spi.writebytes2(data_val) # Preferred for potentially large buffers
+            elif isinstance(data_val, (bytes, bytearray, memoryview, np.ndarray)):
+                # Preferred for potentially large buffers: writebytes2 reads
+                # the buffer protocol directly, so no copy is made here
+                self._spi.writebytes2(data_val)
             elif isinstance(data_val, list):
                 self._spi.writebytes2(bytes(data_val)) # Convert list of ints to bytes
             else:
@@ -314,6 +408,19 @@ class ST7789:
             print(f"Error sending data: {e}")
             # Consider re-raising or handling
 
+    def _cmd_data(self, cmd: int, payload: bytes) -> None:
+        """Send a command byte followed by its parameter bytes."""
+        if not self._dc_request or not self._spi:
+            return
+        try:
+            # Command byte with DC low, then the parameters with DC high
+            self._cmd_mode_on()
+            self._spi.writebytes([cmd])
+            self._data_mode_on()
+            self._spi.writebytes2(payload)
+        except Exception as e:
+            print(f"Error sending command 0x{cmd:02X} with data: {e}")
+
     def reset(self) -> None:
         """Perform a hardware reset of the display."""
         if not self._rst_request: return # Avoid error if not initialized
@@ -356,14 +463,12 @@ class ST7789:
         #      0xA0: Landscape inverted (270deg), RGB
         #      0x60: Landscape (90deg), BGR <--- USED HERE
         #      0x70: Landscape (90deg), RGB
-        self.command(ST7789_MADCTL)
-        self.data(0x60) # Set for Landscape (320W x 240H), BGR color order
+        self._cmd_data(ST7789_MADCTL, b'\x60') # Set for Landscape (320W x 240H), BGR color order
 
         # 4: Interface Pixel Format (COLMOD)
         #    0x55 = 16 bits/pixel (RGB565)
         #    0x66 = 18 bits/pixel (RGB666) - Less common for SPI
-        self.command(ST7789_COLMOD)
-        self.data(0x55) # Set RGB565 format
+        self._cmd_data(ST7789_COLMOD, b'\x55') # Set RGB565 format
 
         # 5: Display Inversion ON (Optional)
         #    Some panels require inversion for correct colors.
@@ -400,19 +505,12 @@ class ST7789:
         y0 = max(0, min(y0, self.height - 1))
         y1 = max(0, min(y1, self.height - 1))
 
-        # Set Column Address Range (CASET)
-        self.command(ST7789_CASET)
-        self.data([
-            (x0 >> 8) & 0xFF, x0 & 0xFF,   # Start Column High Byte, Low Byte
-            (x1 >> 8) & 0xFF, x1 & 0xFF    # End Column High Byte, Low Byte
-        ])
+        # Set Column Address Range (CASET): start and end column as
+        # big-endian 16-bit values (high byte first)
+        self._cmd_data(ST7789_CASET, struct.pack('>HH', x0, x1))
 
-        # Set Row Address Range (RASET)
-        self.command(ST7789_RASET)
-        self.data([
-            (y0 >> 8) & 0xFF, y0 & 0xFF,   # Start Row High Byte, Low Byte
-            (y1 >> 8) & 0xFF, y1 & 0xFF    # End Row High Byte, Low Byte
-        ])
+        # Set Row Address Range (RASET): start and end row, same layout
+        self._cmd_data(ST7789_RASET, struct.pack('>HH', y0, y1))
 
         # Enable RAM Writing (RAMWR) - subsequent data() calls write pixels
         self.command(ST7789_RAMWR)
@@ -427,40 +525,92 @@ class ST7789:
         Args:
             image: A PIL (Pillow) Image object.
         """
+        self.flush()
+        packed = self._pack_rgb565(self._screen_pixels(image))
+        self._write_frame(packed)
+
+    def display_image_async(self, image: Image.Image) -> None:
+        """
+        Display a PIL Image object, sending it in the background.
+
+        The image is converted on the calling thread while the previous
+        frame is still being written; spidev releases the GIL during the
+        transfer, so both run in parallel. Suited to animation loops.
+        Call flush() to wait until the last frame has been sent.
+
+        Args:
+            image: A PIL (Pillow) Image object.
+        """
+        buf = self._async_bufs[self._async_index]
+        self._async_index ^= 1
+        packed = self._pack_rgb565(self._screen_pixels(image), buf)
+        # Only one frame is in flight, and it uses the other buffer
+        self.flush()
+        self._pending = self._write_executor.submit(self._write_frame, packed)
+
+    def flush(self) -> None:
+        """Wait until a frame queued by display_image_async has been sent."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def _screen_pixels(self, image: Image.Image) -> np.ndarray:
+        """Return the image as a screen-sized (height, width, 3) uint8 array."""
         # Ensure image is in RGB format
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        # Resize the image to fit the display dimensions
-        img_resized = image.resize((self.width, self.height))
+        # Resize the image to fit the display dimensions. Full-screen images
+        # (e.g. the text canvas) already match and are used without a copy.
+        if image.size != (self.width, self.height):
+            image = image.resize((self.width, self.height))
+
+        # View the PIL image as a (height, width, 3) uint8 NumPy array
+        return np.asarray(image)
+
+    def _write_frame(self, packed: memoryview) -> None:
+        """Write a packed full-screen frame to the display."""
+        # Set the drawing window to the full screen
+        self.set_window()
+
+        # Write the pixel data straight from the buffer, without a bytes copy
+        self.data(packed)
+        self._text_shown = None
+
+    def _pack_rgb565(self, pixels: np.ndarray, buf: Optional[np.ndarray] = None) -> memoryview:
+        """
+        Convert an RGB pixel array to the display's RGB565 byte stream.
+
+        Args:
+            pixels: A (rows, columns, 3) uint8 array, at most screen-sized.
+            buf: Screen-sized uint8 buffer to pack into (default: the
+                 display_image frame buffer).
 
-        # Convert PIL image to NumPy array
-        pixels = np.array(img_resized).astype(np.uint16)
+        Returns:
+            A view of the packed bytes at the start of the buffer,
+            valid until the next packing call into it.
+        """
+        if buf is None:
+            buf = self._pixbuf
+        rows, cols = pixels.shape[:2]
+        size = rows * cols * 2
+        r = pixels[:, :, 0]
+        g = pixels[:, :, 1]
+        b = pixels[:, :, 2]
 
         # Convert 24-bit RGB to 16-bit RGB565 format
         # RRRRRGGG GGGBBBBB
         # Red:   Top 5 bits (xxxxx...)
         # Green: Top 6 bits (...yyyyyy..)
         # Blue:  Top 5 bits (.......zzzzz)
-        r = (pixels[:, :, 0] & 0xF8) << 8  # Shift red bits to MSB position
-        g = (pixels[:, :, 1] & 0xFC) << 3  # Shift green bits to middle position
-        b = (pixels[:, :, 2] & 0xF8) >> 3  # Shift blue bits to LSB position
-
-        # Combine the channels into a single 16-bit value
-        rgb565 = r | g | b
-
-        # Convert the 16-bit data to bytes
-        # ST7789 expects data in Big Endian order (Most Significant Byte first)
-        # NumPy arrays are usually Little Endian by default on x86/ARM
-        # .byteswap() swaps the byte order within each 16-bit element
-        # .tobytes() converts the NumPy array to a flat byte sequence
-        pixel_bytes = rgb565.byteswap().tobytes()
-
-        # Set the drawing window to the full screen
-        self.set_window()
-
-        # Write the pixel data
-        self.data(pixel_bytes)
+        # ST7789 expects data in Big Endian order (Most Significant Byte first),
+        # so both bytes of each pixel are built directly in uint8, high byte
+        # first, without widening to uint16 and byteswapping. The result is
+        # written into the preallocated frame buffer.
+        rgb565 = buf.reshape(-1)[:size].reshape(rows, cols, 2)
+        rgb565[:, :, 0] = (r & 0xF8) | (g >> 5)         # RRRRRGGG
+        rgb565[:, :, 1] = ((g & 0x1C) << 3) | (b >> 3)  # GGGBBBBB
+        return memoryview(buf).cast('B')[:size]
 
     def clear(self, color: Tuple[int, int, int] = (0, 0, 0)) -> None:
         """
@@ -470,11 +620,21 @@ class ST7789:
             color: A tuple representing the RGB color (e.g., (255, 0, 0) for red).
                    Defaults to black (0, 0, 0).
         """
-        # Create a blank image with the specified background color
-        # Although slightly less efficient than sending a repeated color value,
-        # this reuses the optimized display_image path.
-        img = Image.new('RGB', (self.width, self.height), color)
-        self.display_image(img)
+        # Convert the color to one big-endian RGB565 value, the same way
+        # display_image packs pixels, and repeat it over the whole screen.
+        # This skips Pillow and NumPy; the filled frame is cached per color.
+        self.flush()
+        r, g, b = color
+        value = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        fill = self._fill_cache.get(value)
+        if fill is None:
+            fill = value.to_bytes(2, 'big') * (self.width * self.height)
+            self._fill_cache[value] = fill
+
+        # Set the drawing window to the full screen and write the fill
+        self.set_window()
+        self.data(fill)
+        self._text_shown = None
 
     def draw_text(self,
                   text: str,
@@ -486,8 +646,10 @@ class ST7789:
         """
         Draw text onto the display using a specified TTF font.
 
-        Creates an image buffer, draws the text onto it, and then displays
-        the buffer.
+        Repaints the reusable text canvas, draws the text onto it, and then
+        displays the canvas. If the panel still shows the previous text on
+        the same background, only the area covering the old and new text
+        is sent.
 
         Args:
             text: The string to display.
@@ -497,9 +659,12 @@ class ST7789:
             text_color: RGB tuple for the text color.
             bg_color: RGB tuple for the background color.
         """
-        # Create a new image with the desired background color
-        image = Image.new('RGB', (self.width, self.height), bg_color)
-        draw = ImageDraw.Draw(image)
+        self.flush()
+
+        # Fill the reusable canvas with the desired background color
+        image = self._text_canvas
+        draw = self._text_draw
+        draw.rectangle((0, 0, self.width, self.height), fill=bg_color)
 
         # Load the font
         try:
@@ -522,8 +687,27 @@ class ST7789:
         # Draw the text onto the image buffer
         draw.text(position, text, font=font, fill=text_color)
 
-        # Display the image buffer on the screen
-        self.display_image(image)
+        # Box covering the new text, clipped to the screen
+        left, top, right, bottom = draw.textbbox(position, text, font=font)
+        text_box = (max(left, 0), max(top, 0), min(right, self.width), min(bottom, self.height))
+        if text_box[0] >= text_box[2] or text_box[1] >= text_box[3]:
+            # Nothing visible: an inverted box drops out of the union below
+            text_box = (self.width, self.height, 0, 0)
+
+        if self._text_shown is None or self._text_shown[0] != bg_color:
+            # Display the whole image buffer on the screen
+            self.display_image(image)
+        else:
+            # Everything outside the old and new text already shows the
+            # background, so only send the box covering both
+            old_box = self._text_shown[1]
+            x0, y0 = min(old_box[0], text_box[0]), min(old_box[1], text_box[1])
+            x1, y1 = max(old_box[2], text_box[2]), max(old_box[3], text_box[3])
+            if x0 < x1 and y0 < y1:
+                packed = self._pack_rgb565(np.asarray(image)[y0:y1, x0:x1])
+                self.set_window(x0, y0, x1 - 1, y1 - 1)
+                self.data(packed)
+        self._text_shown = (bg_color, text_box)
 
 # --- Main Execution ---
 if __name__ == "__main__":
@@ -554,8 +738,9 @@ if __name__ == "__main__":
                         help='SPI port number (e.g., 0 for /dev/spidevN.x)')
     parser.add_argument('--spi-device', type=int, default=0, metavar='N',
                         help='SPI device/chip-select number (e.g., 0 for /dev/spidevX.n)')
-    parser.add_argument('--spi-speed', type=int, default=40_000_000, metavar='HZ',
-                        help='SPI clock speed in Hz (e.g., 40000000 for 40MHz)')
+    parser.add_argument('--spi-speed', type=int, default=SPI_SPEED_HZ, metavar='HZ',
+                        help='SPI clock speed in Hz (panel maximum 62500000; lower it, '
+                             'e.g. 40000000, if the picture glitches)')
     parser.add_argument('--dc-pin', type=int, required=True, metavar='NUM', # Made required
                         help='GPIO pin number (Linux sysfs numbering) for DC.')
     parser.add_argument('--rst-pin', type=int, required=True, metavar='NUM', # Made required
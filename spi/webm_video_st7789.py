@@ -6,15 +6,20 @@ https://github.com/c0m4r
 License: Public Domain
 """
 
+import argparse
+import mmap
 import time
 import spidev
 import gpiod
 from gpiod.line import Direction, Value # Import constants as shown in example
 import numpy as np
 import subprocess
-from PIL import Image
 import sys
 import os
+import fcntl
+import struct
+import queue
+import threading
 
 # --- Configuration ---
 
@@ -40,48 +45,78 @@ ROTATION = 0x60 # Example: Landscape
 SPI_BUS = 0
 SPI_DEVICE = 0
 SPI_MAX_SPEED_HZ = 80000000 # 80 MHz (adjust if needed)
-SPI_CHUNK_SIZE = 4096       # Max bytes to write in one SPI call
+# spidev splits each write into transfers of at most bufsiz bytes (default
+# 4096, 38 per frame). Set 'spidev.bufsiz=65536' on the kernel command line
+# (or 'modprobe spidev bufsiz=65536') to send a frame in 3 transfers.
+SPIDEV_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
 
 # Video Processing
 TARGET_FPS = 25
+# Let ffmpeg output big-endian RGB565, the display's own pixel format, so
+# frames go to SPI as-is. Set to False to read RGB24 and convert in Python.
+FFMPEG_RGB565 = True
+# Scaler used by ffmpeg. At 320x240 on a 2" panel bilinear looks the same as
+# lanczos for typical 720p/1080p sources, for a fraction of the CPU time.
+SCALE_FLAGS = 'bilinear'
+# 'rkrga' decodes with rkmpp and scales on the RK3582's RGA block instead of
+# the CPU; it needs an ffmpeg built with Rockchip support (ffmpeg-rockchip).
+SCALE_CHOICES = ('fast_bilinear', 'bilinear', 'bicubic', 'lanczos', 'rkrga')
+FRAME_QUEUE_SIZE = 2 # Frames buffered between pipeline stages
+FFMPEG_PIPE_SIZE = 1 << 20 # 1 MB ffmpeg stdout buffer, holds several whole frames
 
 # Global SPI object
 spi = None
 
+# Last DC level and address window sent, so unchanged ones are skipped
+dc_level = None
+address_window = None
+
 # --- Helper Functions ---
 
-def spi_write(data_list):
-    """Writes a list of bytes to SPI, handling chunking."""
+def spi_write(data):
+    """Writes bytes (or a list of ints) to SPI in a single call."""
     global spi
     if not spi:
         print("Error: SPI not initialized.", file=sys.stderr)
         return
     try:
-        for i in range(0, len(data_list), SPI_CHUNK_SIZE):
-            spi.writebytes(data_list[i:i+SPI_CHUNK_SIZE])
+        # writebytes2 reads buffer objects without copying them into a list
+        # and splits large writes at the spidev bufsiz limit by itself
+        # (/sys/module/spidev/parameters/bufsiz, raise it to cut transfers)
+        spi.writebytes2(data)
     except Exception as e:
         print(f"Error during SPI write: {e}", file=sys.stderr)
         # Depending on error, might want to re-init SPI or exit
 
+def read_spi_bufsiz():
+    """Returns the spidev per-transfer size limit, or its 4096 default."""
+    try:
+        with open(SPIDEV_BUFSIZ_PATH) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 4096
+
+def set_dc(value, gpio_request):
+    """Drives the DC line, skipping the GPIO call if it's already at that level."""
+    global dc_level
+    if dc_level != value:
+        gpio_request.set_value(DC_LINE_OFFSET, value)
+        dc_level = value
+
 def write_command(cmd, gpio_request):
     """Sets DC low and sends a command byte via SPI."""
-    gpio_request.set_value(DC_LINE_OFFSET, Value.INACTIVE) # DC low
+    set_dc(Value.INACTIVE, gpio_request) # DC low
     spi_write([cmd])
 
 def write_data(data, gpio_request):
     """Sets DC high and sends data byte(s) via SPI."""
-    gpio_request.set_value(DC_LINE_OFFSET, Value.ACTIVE) # DC high
-    data_list = []
+    set_dc(Value.ACTIVE, gpio_request) # DC high
     if isinstance(data, int):
-        data_list = [data]
-    elif isinstance(data, (bytes, bytearray)):
-        data_list = list(data) # Convert bytes/bytearray to list of ints
-    elif isinstance(data, list):
-        data_list = data # Assume list of ints
-    else:
+        data = [data]
+    elif not isinstance(data, (bytes, bytearray, memoryview, list)):
         print(f"Warning: Unsupported data type for write_data: {type(data)}", file=sys.stderr)
         return
-    spi_write(data_list)
+    spi_write(data) # Buffers go straight to spidev, no per-byte list
 
 def reset_display(gpio_request):
     """Resets the display using the RST line."""
@@ -94,8 +129,11 @@ def reset_display(gpio_request):
 
 def init_display(gpio_request):
     """Initializes the ST7789 display sequence."""
+    global dc_level, address_window
     print("Initializing display...")
+    dc_level = None # Line state of a fresh GPIO request is not assumed
     reset_display(gpio_request)
+    address_window = None # Reset clears the window registers, so send it again
 
     write_command(0x11, gpio_request) # Sleep out
     time.sleep(0.12)
@@ -120,53 +158,139 @@ def init_display(gpio_request):
 
 def set_address_window(x0, y0, x1, y1, gpio_request):
     """Sets the drawing window area on the display."""
-    write_command(0x2A, gpio_request) # Column address set (CASET)
-    write_data([ (x0 >> 8) & 0xFF, x0 & 0xFF, (x1 >> 8) & 0xFF, x1 & 0xFF ], gpio_request)
-    write_command(0x2B, gpio_request) # Row address set (RASET)
-    write_data([ (y0 >> 8) & 0xFF, y0 & 0xFF, (y1 >> 8) & 0xFF, y1 & 0xFF ], gpio_request)
+    global address_window
+    columns, rows = (x0, x1), (y0, y1)
+    current_columns, current_rows = address_window or (None, None)
+    # Only resend the ranges that changed: RAMWR alone restarts writing at
+    # the top-left of the current window, so repeated full-screen frames
+    # cost two DC toggles instead of six
+    if columns != current_columns:
+        write_command(0x2A, gpio_request) # Column address set (CASET)
+        write_data(struct.pack('>HH', x0, x1), gpio_request) # Big-endian start, end
+    if rows != current_rows:
+        write_command(0x2B, gpio_request) # Row address set (RASET)
+        write_data(struct.pack('>HH', y0, y1), gpio_request)
+    address_window = (columns, rows)
     write_command(0x2C, gpio_request) # Memory write command (RAMWR) - data follows
 
-def display_frame_rgb565(img, gpio_request):
-    """Converts PIL RGB Image to RGB565 and sends to display."""
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-
-    # Convert to NumPy array
-    pixel_data_rgb888 = np.array(img, dtype=np.uint8)
-
-    # Convert RGB888 to RGB565
-    r = (pixel_data_rgb888[:,:,0].astype(np.uint16) >> 3)
-    g = (pixel_data_rgb888[:,:,1].astype(np.uint16) >> 2)
-    b = (pixel_data_rgb888[:,:,2].astype(np.uint16) >> 3)
-    pixel_data_rgb565 = (r << 11) | (g << 5) | b
-
-    # Convert to big-endian bytes (>u2 = big-endian unsigned 16-bit)
-    pixel_data_bytes = pixel_data_rgb565.astype('>u2').tobytes()
-
+def display_frame_rgb565(in_bytes, gpio_request):
+    """Converts a raw RGB24 frame to RGB565 and sends to display."""
+    display_frame_raw(convert_frame_rgb565(in_bytes), gpio_request)
+
+def convert_frame_rgb565(in_bytes, out=None):
+    """Converts a raw RGB24 frame to big-endian RGB565 bytes, into out if given."""
+    # View the frame as a NumPy array without copying it
+    pixel_data_rgb888 = np.frombuffer(in_bytes, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+
+    # Convert RGB888 to big-endian RGB565, building the high and low byte of
+    # each pixel directly in uint8 (no uint16 temporaries or byteswap)
+    r = pixel_data_rgb888[:,:,0]
+    g = pixel_data_rgb888[:,:,1]
+    b = pixel_data_rgb888[:,:,2]
+    if out is None:
+        out = bytearray(WIDTH * HEIGHT * 2)
+    pixel_data_rgb565 = np.frombuffer(out, dtype=np.uint8).reshape(HEIGHT, WIDTH, 2)
+    pixel_data_rgb565[:,:,0] = (r & 0xF8) | (g >> 5)        # RRRRRGGG
+    pixel_data_rgb565[:,:,1] = ((g & 0x1C) << 3) | (b >> 3) # GGGBBBBB
+    return out
+
+def display_frame_raw(frame_bytes, gpio_request):
+    """Sends a full frame of big-endian RGB565 bytes to the display."""
     # Set window to full screen
     set_address_window(0, 0, WIDTH - 1, HEIGHT - 1, gpio_request)
 
     # Send pixel data
-    write_data(pixel_data_bytes, gpio_request)
+    write_data(frame_bytes, gpio_request)
 
-def extract_frames(input_file):
-    """Starts ffmpeg to extract frames as raw RGB24 data pipe."""
-    print(f"Starting ffmpeg for {input_file} at {TARGET_FPS} FPS...")
-    command = [
+def has_rkrga():
+    """Checks whether ffmpeg was built with the Rockchip RGA scaler."""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-filters'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return False
+    return 'scale_rkrga' in result.stdout
+
+def ffmpeg_command(input_file, pix_fmt, output='-', realtime=False, scale_flags=SCALE_FLAGS):
+    """Builds the ffmpeg command that scales frames to the display as raw video."""
+    if scale_flags == 'rkrga':
+        # Hardware decode, then RGA scales and converts to RGB565 before the
+        # frames are copied back; ffmpeg only swaps the bytes to big-endian
+        hwaccel = ['-hwaccel', 'rkmpp', '-hwaccel_output_format', 'drm_prime']
+        vf = f'fps={TARGET_FPS},scale_rkrga=w={WIDTH}:h={HEIGHT}:format=rgb565le,hwdownload,format=rgb565le'
+    else:
+        hwaccel = []
+        vf = f'fps={TARGET_FPS},scale={WIDTH}:{HEIGHT}:flags={scale_flags}'
+    return [
         'ffmpeg',
         '-loglevel', 'warning',  # Reduce verbose output, show errors/warnings
         '-nostdin',             # Don't read from stdin
+        *(['-re'] if realtime else []), # Read input at its native rate, pacing playback
+        *hwaccel,
         '-i', input_file,
-        '-vf', f'fps={TARGET_FPS},scale={WIDTH}:{HEIGHT}:flags=lanczos', # Filtergraph
-        '-pix_fmt', 'rgb24',    # Output format: 8-bit R, G, B
+        '-vf', vf,              # Filtergraph
+        '-pix_fmt', pix_fmt,    # Output format: 16-bit RGB565 big-endian, or 8-bit R, G, B
         '-f', 'rawvideo',       # Output container format
-        '-',                    # Output to stdout
+        '-y', output,           # Output to stdout ('-') or a file
     ]
+
+def precache_video(input_file, cache_file, scale_flags=SCALE_FLAGS):
+    """Converts the video once into a raw RGB565 frame file for later playback."""
+    print(f"Precaching {input_file} to {cache_file}...")
+    tmp_file = cache_file + '.tmp' # Only a finished cache replaces the old one
     try:
-        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=-1)
-        # Check immediately if it errored on startup
+        result = subprocess.run(ffmpeg_command(input_file, 'rgb565be', tmp_file, scale_flags=scale_flags))
+    except FileNotFoundError:
+        print("Error: 'ffmpeg' command not found. Is ffmpeg installed and in PATH?", file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        print(f"Error: ffmpeg failed to precache. Exit code: {result.returncode}", file=sys.stderr)
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        return False
+    os.replace(tmp_file, cache_file)
+    print("Precache complete.")
+    return True
+
+def display_frame_changes(frame_bytes, last_frame, gpio_request):
+    """Sends only the rectangle where the frame differs from last_frame.
+
+    Updates last_frame and returns False if nothing changed.
+    """
+    new = np.frombuffer(frame_bytes, dtype=np.uint16).reshape(HEIGHT, WIDTH)
+    old = np.frombuffer(last_frame, dtype=np.uint16).reshape(HEIGHT, WIDTH)
+    changed = new != old
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not rows.size:
+        return False # Repeated frame, the display already shows it
+    cols = np.flatnonzero(changed.any(axis=0))
+    y0, y1, x0, x1 = int(rows[0]), int(rows[-1]), int(cols[0]), int(cols[-1])
+
+    if (y1 - y0 + 1) * (x1 - x0 + 1) * 2 > WIDTH * HEIGHT:
+        # Mostly changed: send it whole, keeping the full-screen window
+        display_frame_raw(frame_bytes, gpio_request)
+    else:
+        set_address_window(x0, y0, x1, y1, gpio_request)
+        write_data(new[y0:y1 + 1, x0:x1 + 1].tobytes(), gpio_request)
+    last_frame[:] = frame_bytes
+    return True
+
+def extract_frames(input_file, scale_flags=SCALE_FLAGS):
+    """Starts ffmpeg to extract frames as a raw RGB565 (or RGB24) data pipe."""
+    pix_fmt = 'rgb565be' if FFMPEG_RGB565 else 'rgb24'
+    print(f"Starting ffmpeg for {input_file} at {TARGET_FPS} FPS ({pix_fmt})...")
+    command = ffmpeg_command(input_file, pix_fmt, realtime=True, scale_flags=scale_flags)
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=FFMPEG_PIPE_SIZE)
+        # The kernel pipe holds only 64 KB by default, so a frame would take
+        # several read() calls. Grow it up to /proc/sys/fs/pipe-max-size.
+        try:
+            fcntl.fcntl(proc.stdout.fileno(), fcntl.F_SETPIPE_SZ, FFMPEG_PIPE_SIZE)
+        except (AttributeError, OSError) as pipe_err:
+            print(f"Warning: Could not enlarge ffmpeg pipe: {pipe_err}", file=sys.stderr)
+        # Check immediately if it errored on startup (a short clip may already
+        # have exited cleanly, with all its frames waiting in the pipe)
         time.sleep(0.1) # Give ffmpeg a moment
-        if proc.poll() is not None:
+        if proc.poll() not in (None, 0):
             stderr_output = proc.stderr.read().decode(errors='ignore')
             print(f"Error: ffmpeg failed to start. Exit code: {proc.returncode}", file=sys.stderr)
             print("FFmpeg stderr:\n", stderr_output, file=sys.stderr)
@@ -180,26 +304,111 @@ def extract_frames(input_file):
         print(f"Error starting ffmpeg: {e}", file=sys.stderr)
         return None
 
+def read_frames(ffmpeg_proc, frame_size, raw_queue):
+    """Pipeline stage 1: reads raw frames from ffmpeg, None marks the end."""
+    # Frames are read into preallocated buffers, reused in turn. RGB565
+    # frames pass on unconverted, so a buffer can still wait in both queues
+    # and be held by the conversion and SPI stages; the pool covers all that.
+    in_bufs = [bytearray(frame_size) for _ in range(2 * FRAME_QUEUE_SIZE + 3)]
+    in_index = 0
+    try:
+        while True:
+            in_buf = in_bufs[in_index]
+            read_size = ffmpeg_proc.stdout.readinto(in_buf)
+
+            if not read_size:
+                print("End of video stream (ffmpeg stdout closed).")
+                break # End of stream
+
+            if read_size < frame_size:
+                print(f"Warning: Incomplete frame received ({read_size}/{frame_size}). Assuming end.", file=sys.stderr)
+                break
+
+            raw_queue.put(in_buf)
+            in_index = (in_index + 1) % len(in_bufs)
+    except Exception as read_err:
+        print(f"Error reading frame from ffmpeg: {read_err}", file=sys.stderr)
+    finally:
+        raw_queue.put(None)
+
+def read_cached_frames(cache, frame_size, frame_queue):
+    """Pipeline source for precached video: slices frames out of the mapped file."""
+    frames = memoryview(cache)
+    for offset in range(0, len(cache) - frame_size + 1, frame_size):
+        frame_queue.put(frames[offset:offset + frame_size])
+    print("End of precached video.")
+    frame_queue.put(None)
+
+def convert_frames(raw_queue, frame_queue):
+    """Pipeline stage 2: turns raw frames into RGB565 bytes, None marks the end."""
+    # Output buffers are reused in turn. A buffer comes round again only after
+    # the queue and the SPI stage have moved past it: at most FRAME_QUEUE_SIZE
+    # frames wait in the queue and one is being written.
+    out_bufs = [bytearray(WIDTH * HEIGHT * 2) for _ in range(FRAME_QUEUE_SIZE + 2)]
+    out_index = 0
+    while (in_bytes := raw_queue.get()) is not None:
+        if FFMPEG_RGB565:
+            # ffmpeg already produced display-ready bytes
+            frame_queue.put(in_bytes)
+            continue
+
+        frame_queue.put(convert_frame_rgb565(in_bytes, out_bufs[out_index]))
+        out_index = (out_index + 1) % len(out_bufs)
+    frame_queue.put(None)
+
 # --- Main Playback Logic ---
 
-def play_video(video_path):
+def play_video(video_path, precache=False, spi_hz=SPI_MAX_SPEED_HZ, scale_flags=SCALE_FLAGS, dedup=False):
     global spi
     if not os.path.isfile(video_path):
         print(f"Error: Video file not found: '{video_path}'", file=sys.stderr)
         return
 
-    frame_size = WIDTH * HEIGHT * 3 # 3 bytes per pixel (RGB24)
+    frame_size = WIDTH * HEIGHT * (2 if FFMPEG_RGB565 else 3) # 2 bytes per pixel (RGB565), 3 for RGB24
     frame_interval = 1.0 / TARGET_FPS
     ffmpeg_proc = None
+    cache = None
+
+    if scale_flags == 'rkrga' and not has_rkrga():
+        print(f"Warning: ffmpeg has no scale_rkrga filter, scaling with {SCALE_FLAGS} instead.", file=sys.stderr)
+        scale_flags = SCALE_FLAGS
+
+    if precache:
+        # Decode and scale once; later runs play the cached frames directly
+        # Name the cache after every setting baked into its frames, so a
+        # different scaler, rate or size gets its own cache instead of
+        # silently replaying an old one
+        base = os.path.splitext(video_path)[0]
+        cache_file = f"{base}.{WIDTH}x{HEIGHT}.{TARGET_FPS}fps.{scale_flags}.rgb565"
+        if (not os.path.isfile(cache_file)
+                or os.path.getmtime(cache_file) < os.path.getmtime(video_path)):
+            if not precache_video(video_path, cache_file, scale_flags):
+                return
+        frame_size = WIDTH * HEIGHT * 2 # The cache always holds RGB565
+        if os.path.getsize(cache_file) < frame_size:
+            print(f"Error: Precached video is empty: '{cache_file}'", file=sys.stderr)
+            return
+        with open(cache_file, 'rb') as cache_fd:
+            cache = mmap.mmap(cache_fd.fileno(), 0, access=mmap.ACCESS_READ)
 
     try:
         # --- Initialize SPI ---
         print("Initializing SPI...")
         spi = spidev.SpiDev()
         spi.open(SPI_BUS, SPI_DEVICE)
-        spi.max_speed_hz = SPI_MAX_SPEED_HZ
+        spi.max_speed_hz = spi_hz
         spi.mode = 0
-        print(f"SPI initialized: Bus {SPI_BUS}, Device {SPI_DEVICE}, Speed {SPI_MAX_SPEED_HZ} Hz")
+        print(f"SPI initialized: Bus {SPI_BUS}, Device {SPI_DEVICE}, Speed {spi_hz} Hz")
+        # Read back what spidev kept; the controller may still divide its
+        # source clock down to the nearest rate below this
+        actual_hz = spi.max_speed_hz
+        wire_time = WIDTH * HEIGHT * 2 * 8 / actual_hz
+        print(f"Actual SPI clock: {actual_hz} Hz ({wire_time * 1000:.1f} ms per frame on the wire)")
+        if wire_time > frame_interval:
+            print(f"Warning: SPI clock too slow for {TARGET_FPS} FPS, raise --spi-hz.", file=sys.stderr)
+        spi_bufsiz = min(read_spi_bufsiz(), 65535) # writebytes2 caps blocks at 65535
+        transfers = -(-WIDTH * HEIGHT * 2 // spi_bufsiz)
+        print(f"spidev bufsiz: {spi_bufsiz} bytes ({transfers} transfers per frame)")
 
         # --- Initialize GPIO using gpiod.request_lines ---
         print(f"Requesting GPIO lines on {GPIO_CHIP_PATH}...")
@@ -228,58 +437,63 @@ def play_video(video_path):
 
             # Optional: Clear display
             print("Clearing display...")
-            black_frame = Image.new('RGB', (WIDTH, HEIGHT), (0, 0, 0))
-            display_frame_rgb565(black_frame, gpio_request)
+            display_frame_raw(bytes(WIDTH * HEIGHT * 2), gpio_request) # Black is all zeros in RGB565
             print("Display cleared.")
 
-            # --- Start FFmpeg ---
-            ffmpeg_proc = extract_frames(video_path)
-            if not ffmpeg_proc:
-                return # Exit if ffmpeg failed to start
-
-            # --- Playback Loop ---
+            # --- Start Pipeline ---
+            # Reading and converting run in their own threads, so the next
+            # frames are ready while the current one goes out over SPI.
+            # Bounded queues keep them at most a couple of frames ahead.
+            frame_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+            if cache is not None:
+                # Precached frames are display-ready, no ffmpeg or conversion
+                threading.Thread(target=read_cached_frames, args=(cache, frame_size, frame_queue), daemon=True).start()
+            else:
+                # --- Start FFmpeg ---
+                ffmpeg_proc = extract_frames(video_path, scale_flags)
+                if not ffmpeg_proc:
+                    return # Exit if ffmpeg failed to start
+
+                raw_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+                threading.Thread(target=read_frames, args=(ffmpeg_proc, frame_size, raw_queue), daemon=True).start()
+                threading.Thread(target=convert_frames, args=(raw_queue, frame_queue), daemon=True).start()
+
+            # --- Playback Loop (pipeline stage 3: SPI writes) ---
             print("Starting video playback loop...")
             frame_count = 0
+            skipped_count = 0
+            # Copy of the last frame sent (the display starts out black). The
+            # frame buffers themselves get reused, so they can't be kept.
+            last_frame = bytearray(WIDTH * HEIGHT * 2) if dedup else None
             start_time = time.monotonic()
             last_fps_update_time = start_time
 
             while True:
                 loop_start_time = time.monotonic()
 
-                # Read frame from ffmpeg
-                try:
-                    in_bytes = ffmpeg_proc.stdout.read(frame_size)
-                except Exception as read_err:
-                    print(f"Error reading frame from ffmpeg: {read_err}", file=sys.stderr)
-                    break # Exit loop
-
-                if not in_bytes:
-                    print("End of video stream (ffmpeg stdout closed).")
+                # Take the next converted frame
+                frame_bytes = frame_queue.get()
+                if frame_bytes is None:
                     break # End of stream
 
-                if len(in_bytes) < frame_size:
-                    print(f"Warning: Incomplete frame received ({len(in_bytes)}/{frame_size}). Assuming end.", file=sys.stderr)
-                    break
-
-                # Convert bytes to PIL Image
-                try:
-                    frame_image = Image.frombytes('RGB', (WIDTH, HEIGHT), in_bytes)
-                except Exception as img_err:
-                    print(f"Error creating Image from bytes: {img_err}", file=sys.stderr)
-                    continue # Skip this frame
-
-                # Display the frame
-                display_frame_rgb565(frame_image, gpio_request)
+                # Display the frame (or just what changed in it)
+                if last_frame is None:
+                    display_frame_raw(frame_bytes, gpio_request)
+                elif not display_frame_changes(frame_bytes, last_frame, gpio_request):
+                    skipped_count += 1
                 frame_count += 1
 
                 # --- Frame Rate Control ---
-                loop_end_time = time.monotonic()
-                processing_time = loop_end_time - loop_start_time
-                sleep_time = frame_interval - processing_time
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                # else:
-                #     print(f"Frame {frame_count}: Took too long ({processing_time:.4f}s)")
+                # ffmpeg -re hands out frames in real time, so the blocking
+                # read paces playback; only precached frames need a sleep
+                if cache is not None:
+                    loop_end_time = time.monotonic()
+                    processing_time = loop_end_time - loop_start_time
+                    sleep_time = frame_interval - processing_time
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
+                    # else:
+                    #     print(f"Frame {frame_count}: Took too long ({processing_time:.4f}s)")
 
                 # Optional: Periodic FPS update
                 current_time = time.monotonic()
@@ -297,6 +511,8 @@ def play_video(video_path):
             if total_time > 0:
                 avg_fps = frame_count / total_time
                 print(f"Average FPS: {avg_fps:.2f}")
+            if dedup:
+                print(f"Skipped {skipped_count} repeated frames.")
 
 
     except FileNotFoundError as e:
@@ -314,7 +530,7 @@ def play_video(video_path):
          print(f"Error interacting with device: {e}", file=sys.stderr)
     except ImportError as e:
         print(f"Error: Missing Python library: {e}", file=sys.stderr)
-        print("Ensure 'spidev', 'gpiod', 'Pillow', 'numpy' are installed (`pip install ...`)")
+        print("Ensure 'spidev', 'gpiod', 'numpy' are installed (`pip install ...`)")
     except KeyboardInterrupt:
         print("\nPlayback stopped by user (Ctrl+C).")
     except Exception as e:
@@ -354,8 +570,21 @@ def play_video(video_path):
 # --- Script Entry Point ---
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(f"Usage: python {sys.argv[0]} <video_file_path>")
+    parser = argparse.ArgumentParser(description="Play a video on an ST7789 display.")
+    parser.add_argument('video', nargs='?', help='Path to the video file.')
+    parser.add_argument('--precache', action='store_true',
+                        help='Convert the video once to a raw <video>.<settings>.rgb565 file next to it and play from that file.')
+    parser.add_argument('--spi-hz', type=int, default=SPI_MAX_SPEED_HZ, metavar='HZ',
+                        help=f'SPI clock speed in Hz (default: {SPI_MAX_SPEED_HZ}). Short wiring often allows 96-100 MHz.')
+    parser.add_argument('--quality', choices=SCALE_CHOICES, default=SCALE_FLAGS,
+                        help=f'ffmpeg scaler (default: {SCALE_FLAGS}). fast_bilinear uses the least CPU, '
+                             'rkrga offloads decoding and scaling to Rockchip hardware.')
+    parser.add_argument('--dedup', action='store_true',
+                        help="Only send the part of each frame that changed, skipping repeated frames (helps low-motion video).")
+    args = parser.parse_args()
+
+    if args.video is None:
+        parser.print_usage()
         # Example: Try a default file if none provided
         default_video = "video.webm"
         print(f"No video file provided. Trying default: '{default_video}'")
@@ -365,6 +594,7 @@ if __name__ == "__main__":
             print(f"Default video '{default_video}' not found. Exiting.", file=sys.stderr)
             sys.exit(1)
     else:
-        video_file = sys.argv[1]
+        video_file = args.video
 
-    play_video(video_file)
+    play_video(video_file, precache=args.precache, spi_hz=args.spi_hz, scale_flags=args.quality,
+               dedup=args.dedup)